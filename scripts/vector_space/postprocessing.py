@@ -6,6 +6,8 @@ import pandas as pd
 
 from lipid_data_processing.notation.parsing import ParsedDataset
 
+from lipidome_projector.database.in_memory_df_db import write_pickle_db_file
+
 logging.basicConfig(level=logging.INFO)
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -57,3 +59,10 @@ combined_parsed_db.df.to_csv(output_dir_path / "database.zip")
 vectors_df_2d.to_csv(output_dir_path / "vectors_2d.zip")
 vectors_df_3d.to_csv(output_dir_path / "vectors_3d.zip")
 combined_smiles.to_csv(output_dir_path / "smiles.zip")
+
+# Pickle files with out-of-band buffers, which the database reads without
+# copying the data.
+write_pickle_db_file(combined_parsed_db.df, output_dir_path / "database.pkl")
+write_pickle_db_file(vectors_df_2d, output_dir_path / "vectors_2d.pkl")
+write_pickle_db_file(vectors_df_3d, output_dir_path / "vectors_3d.pkl")
+write_pickle_db_file(combined_smiles, output_dir_path / "smiles.pkl")
@@ -1,6 +1,7 @@
 """Module concerning colors."""
 
 import colorsys
+import functools
 import logging
 
 from itertools import cycle
@@ -33,6 +34,7 @@ def rgb_to_hex(rgb: tuple[int, int, int]) -> str:
     return hex_color
 
 
+@functools.lru_cache(maxsize=1024)
 def rgb_str_to_hex(rgb: str) -> str:
     """Convert an RGB string to a hex string.
     :param rgb: The RGB string of format 'rgb(r, g, b)'.
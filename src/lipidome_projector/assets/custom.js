@@ -1,5 +1,40 @@
 var currentTooltip = null;  // Variable to keep track of the current tooltip
 
+function getTriggeredId() {
+    // Pattern-matching IDs are triggered as their JSON representation.
+    const prop_id = window.dash_clientside.callback_context.triggered[0].prop_id;
+    const id = prop_id.slice(0, prop_id.lastIndexOf('.'));
+    return id.startsWith('{') ? JSON.parse(id) : id;
+}
+
+function stringifyId(id) {
+    // Mirrors how Dash renders pattern-matching IDs into the DOM.
+    if (typeof id !== 'object') {
+        return id;
+    }
+    const parts = Object.keys(id).sort().map(key => `${JSON.stringify(key)}:${JSON.stringify(id[key])}`);
+    return `{${parts.join(',')}}`;
+}
+
+// Buttons of the open tour step, which are controlled by the keyboard.
+var tourKeyButtonIds = null;
+
+document.addEventListener('keydown', function(event) {
+    if (tourKeyButtonIds === null) {
+        return;
+    }
+    let button = null;
+    if (event.key === 'ArrowRight') {
+        button = document.getElementById(tourKeyButtonIds.next);
+    }
+    else if (event.key === 'Escape') {
+        button = document.getElementById(tourKeyButtonIds.close);
+    }
+    if (button) {
+        button.click();
+    }
+});
+
 window.dash_clientside = Object.assign({}, window.dash_clientside, {
     clientside: {
 
@@ -82,29 +117,148 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
             return [fig, config]
         },
 
-        tour_listens_to_keys: function(popover_is_open, next_button_id, close_button_id) {
-            if (popover_is_open) {
-                document.addEventListener('keydown', function(event) {
-                    if (event.key === 'ArrowRight') {
-                        const nextButton = document.getElementById(next_button_id);
-                        if (nextButton) {
-                            nextButton.click();
-                        }
-                    }
-                    else if (event.key === 'Escape') {
-                        const closeButton = document.getElementById(close_button_id);
-                        if (closeButton) {
-                            closeButton.click();
-                        }
-                    }
-                });
+        show_upload_filenames: function(filename_abundances, filename_lipidome_features, filename_fa_constraints, filename_lcb_constraints) {
+            const filenames = [
+                filename_abundances,
+                filename_lipidome_features,
+                filename_fa_constraints,
+                filename_lcb_constraints
+            ];
+            const upload_children = filenames.map(
+                filename => filename ? filename : window.dash_clientside.no_update
+            );
+            const upload_incomplete = !filenames.every(filename => Boolean(filename));
+            return [...upload_children, upload_incomplete];
+        },
+
+        navigate_tour: function(start_tour, next_buttons, close_buttons, chosen_tour, is_open) {
+            const no_update = window.dash_clientside.no_update;
+            const triggered_id = getTriggeredId();
+            // Popovers are identified by the step of their IDs instead of
+            // their position in the layout.
+            const popover_ids = window.dash_clientside.callback_context.states_list[1].map((state) => state.id);
+            if (triggered_id.type === 'tour-close') {
+                return [no_update, false, false, popover_ids.map(() => false)];
+            }
+            else if (triggered_id.type === 'tour-next') {
+                return [no_update, no_update, no_update, popover_ids.map((id) => id.step === triggered_id.step + 1)];
+            }
+            else if (popover_ids.length > 0 && chosen_tour === popover_ids[0].tour) {
+                return [no_update, true, true, popover_ids.map((id) => id.step === 0)];
+            }
+            else if (is_open.some(Boolean)) {
+                return ['loading', true, true, popover_ids.map(() => false)];
+            }
+            throw window.dash_clientside.PreventUpdate;
+        },
+
+        unset_tour_target: function(next_button) {
+            return false;
+        },
+
+        set_next_tour_target: function(is_open, popover_id, tour_state) {
+            if (is_open) {
+                return tour_state.tours[popover_id.tour][popover_id.step + 1].target_id;
+            }
+            throw window.dash_clientside.PreventUpdate;
+        },
+
+        set_start_tour_targets: function(start_tour, popover_id, tour_state) {
+            const tour_steps = tour_state.tours[popover_id.tour];
+            return [tour_steps[0].target_id, tour_steps[1].target_id];
+        },
+
+        tour_listens_to_keys: function(popovers_are_open, next_button_ids, close_button_ids) {
+            const open_popover = window.dash_clientside.callback_context.inputs_list[0].find((input) => input.value);
+            if (open_popover === undefined) {
+                tourKeyButtonIds = null;
             }
             else {
-                document.removeEventListener('keydown', function(event){});
+                const step = open_popover.id.step;
+                tourKeyButtonIds = {
+                    next: stringifyId(next_button_ids.find((id) => id.step === step)),
+                    close: stringifyId(close_button_ids.find((id) => id.step === step)),
+                };
             }
             return window.dash_clientside.no_update;
         },
 
+        toggle_theme: function(theme_switch, url) {
+            // Theme stylesheets are looked up or created once and then only
+            // enabled or disabled, instead of querying and rewriting all
+            // stylesheet links on every toggle.
+            var links = window.__themeLinks || (window.__themeLinks = {});
+            var themeLink = theme_switch ? url[0] : url[1];
+            var oldThemeLink = theme_switch ? url[1] : url[0];
+            var theme = theme_switch ? 'dark' : 'light';
+            var oldTheme = theme_switch ? 'light' : 'dark';
+
+            var findLink = function (href) {
+                return document.querySelector("link[rel='stylesheet'][href*='" + href + "']");
+            };
+
+            if (!links[oldTheme]) {
+                links[oldTheme] = findLink(oldThemeLink);
+            }
+            if (!links[theme]) {
+                var link = findLink(themeLink);
+                if (!link) {
+                    link = document.createElement('link');
+                    link.rel = 'stylesheet';
+                    link.href = themeLink;
+                    // Insert before the other theme to keep custom.css last,
+                    // so that custom changes to theme vars still apply.
+                    var before = links[oldTheme] || findLink('/assets/custom.css');
+                    document.head.insertBefore(link, before);
+                }
+                link.setAttribute('data-theme', theme);
+                links[theme] = link;
+            }
+
+            var active = links[theme];
+            var inactive = links[oldTheme];
+            active.disabled = false;
+            if (inactive) {
+                if (active.sheet) {
+                    inactive.disabled = true;
+                } else {
+                    // Keep the old theme until the new one has loaded.
+                    active.addEventListener('load', function () {
+                        inactive.disabled = !active.disabled;
+                    }, {once: true});
+                }
+            }
+
+            var themeName = themeLink.split('/').pop().replace('.css', '').toLowerCase();
+            return themeName;
+        },
+
+        request_dropdown_options: function(n_clicks, value, options) {
+            if (options && options.length > 0) {
+                return window.dash_clientside.no_update;
+            }
+            return true;
+        },
+
+        update_fullscreen_size: function(data) {
+            if (data === null) {
+                return window.dash_clientside.no_update;
+            }
+            var width = window.innerWidth || document.documentElement.clientWidth || document.body.clientWidth;
+            var height = window.innerHeight || document.documentElement.clientHeight || document.body.clientHeight;
+            return {
+                'width': width - 150, 'height': height - 150
+            };
+        },
+
+        show_problem_modal_body: function(is_open, body_children) {
+            if (is_open) {
+                return body_children;
+            } else {
+                return "";
+            }
+        },
+
         updateButtonColor: function(button_click, button_id) {
         let intervalId;
         const button = document.getElementById(button_id);
@@ -46,3 +46,11 @@ def reg_callbacks(
     reg_grid_callbacks_python(front_end, col_names)
     reg_graph_settings_callbacks_python(front_end, col_names)
     reg_data_operation_callbacks_python(front_end, col_names)
+    _reg_component_callbacks(front_end)
+
+
+def _reg_component_callbacks(front_end: FrontEnd) -> None:
+    front_end.fullscreen_size_store.register_callback()
+    front_end.problem_modal.register_callback()
+    front_end.set_color_component.register_callback()
+    front_end.theme_switch.register_callback()
@@ -1,11 +1,20 @@
 """Module concerning callbacks."""
 
-import base64
 import logging
 
+from collections.abc import Callable
 from typing import Literal
 
-from dash import callback, Input, no_update, Output, State
+from dash import (
+    callback,
+    clientside_callback,
+    ClientsideFunction,
+    dcc,
+    Input,
+    no_update,
+    Output,
+    State,
+)
 from dash._callback import NoUpdate
 from dash.exceptions import PreventUpdate
 
@@ -15,14 +24,22 @@ from lipidome_projector.lipidome.col_names import ColNames
 from lipidome_projector.graph.scatter_cfg import ScatterCfg
 from lipidome_projector.lipidome.grid_data import GridDataCollection
 from lipidome_projector.lipidome.session import SessionState
+from lipidome_projector.lipidome.lipidome_front_end_data import (
+    LipidomeFrontEndData,
+)
 from lipidome_projector.lipidome.upload_processing import (
+    LipidomeUploadFailure,
+    LipidomeUploadResults,
     process_lipidome_upload,
-    LipidomeUploadOutput,
 )
 
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_UPLOAD_FAILURE_NO_UPDATES: tuple[NoUpdate, ...] = (no_update,) * 12
+
+_SESSION_UPLOAD_ERROR_NO_UPDATES: tuple[NoUpdate, ...] = (no_update,) * 25
+
 
 def reg_upload_callbacks_python(
     fe: FrontEnd, database: BaseDB, col_names: ColNames
@@ -37,53 +54,29 @@ def reg_upload_callbacks_python(
     def open_upload_modal(n_clicks: int) -> bool:
         return True
 
-    @callback(
+    clientside_callback(
+        ClientsideFunction(
+            namespace="clientside",
+            function_name="show_upload_filenames",
+        ),
         Output(
             fe.upload_abundances.element_id, "children", allow_duplicate=True
         ),
-        Input(fe.upload_abundances.element_id, "filename"),
-        prevent_initial_call=True,
-    )
-    def register_abundance_upload(filename: str) -> str:
-        return filename
-
-    @callback(
         Output(
             fe.upload_lipidome_features.element_id,
             "children",
             allow_duplicate=True,
         ),
-        Input(fe.upload_lipidome_features.element_id, "filename"),
-        prevent_initial_call=True,
-    )
-    def register_lipidome_features_upload(filename: str) -> str:
-        return filename
-
-    @callback(
         Output(
             fe.upload_fa_constraints.element_id,
             "children",
             allow_duplicate=True,
         ),
-        Input(fe.upload_fa_constraints.element_id, "filename"),
-        prevent_initial_call=True,
-    )
-    def register_fa_constraints_upload(filename: str) -> str:
-        return filename
-
-    @callback(
         Output(
             fe.upload_lcb_constraints.element_id,
             "children",
             allow_duplicate=True,
         ),
-        Input(fe.upload_lcb_constraints.element_id, "filename"),
-        prevent_initial_call=True,
-    )
-    def register_lcb_constraints_upload(filename: str) -> str:
-        return filename
-
-    @callback(
         Output(
             fe.upload_initiate_button.element_id,
             "disabled",
@@ -95,21 +88,6 @@ def reg_upload_callbacks_python(
         Input(fe.upload_lcb_constraints.element_id, "filename"),
         prevent_initial_call=True,
     )
-    def enable_upload_initiate_button(
-        filename_abundances: str,
-        filename_lipidome_features: str,
-        filename_fa_constraints: str,
-        filename_lcb_constraints: str,
-    ) -> bool:
-        if (
-            filename_abundances
-            and filename_lipidome_features
-            and filename_fa_constraints
-            and filename_lcb_constraints
-        ):
-            return False
-
-        return True
 
     @callback(
         Output(fe.lipidome_grid.element_id, "rowData", allow_duplicate=True),
@@ -162,9 +140,27 @@ def reg_upload_callbacks_python(
         State(fe.upload_lipidome_features.element_id, "contents"),
         State(fe.upload_fa_constraints.element_id, "contents"),
         State(fe.upload_lcb_constraints.element_id, "contents"),
+        # The background callback manager is provided by the app.
+        background=True,
+        progress=[
+            Output(fe.upload_modal.progress_text_element_id, "children")
+        ],
+        running=[
+            (
+                Output(fe.upload_initiate_button.element_id, "disabled"),
+                True,
+                False,
+            ),
+            (
+                Output(fe.upload_modal.progress_text_element_id, "hidden"),
+                False,
+                True,
+            ),
+        ],
         prevent_initial_call=True,
     )
     def process_lipidome_upload_callback(
+        set_progress: Callable[[tuple[str]], None],
         n_clicks: int,
         abundances_filename: str,
         abundances_contents: str,
@@ -209,54 +205,24 @@ def reg_upload_callbacks_python(
             list,
         ]
     ):
-        lipidome_output: LipidomeUploadOutput = process_lipidome_upload(
-            name=abundances_filename,
-            abundances_contents=abundances_contents,
-            lipidome_features_contents=lipidome_features_contents,
-            fa_constraints_contents=fa_constraints_contents,
-            lcb_constraints_contents=lcb_constraints_contents,
-            database=database,
-            col_names=col_names,
+        lipidome_output: LipidomeUploadResults | LipidomeUploadFailure = (
+            process_lipidome_upload(
+                name=abundances_filename,
+                abundances_contents=abundances_contents,
+                lipidome_features_contents=lipidome_features_contents,
+                fa_constraints_contents=fa_constraints_contents,
+                lcb_constraints_contents=lcb_constraints_contents,
+                database=database,
+                col_names=col_names,
+                report_progress=lambda message: set_progress((message,)),
+            )
         )
 
-        if not lipidome_output.processing_failure:
-            return (
-                lipidome_output.lipidome_fe_data.lipidome_records,
-                lipidome_output.lipidome_fe_data.lipidome_records,
-                lipidome_output.lipidome_fe_data.lipidome_col_groups_defs,
-                lipidome_output.lipidome_fe_data.lipid_records,
-                lipidome_output.lipidome_fe_data.lipid_records,
-                lipidome_output.lipidome_fe_data.lipid_col_groups_defs,
-                lipidome_output.lipidome_fe_data.difference_records,
-                lipidome_output.lipidome_fe_data.difference_records,
-                lipidome_output.lipidome_fe_data.difference_col_groups_defs,
-                lipidome_output.lipidome_fe_data.log2fc_records,
-                lipidome_output.lipidome_fe_data.log2fc_records,
-                lipidome_output.lipidome_fe_data.log2fc_col_groups_defs,
-                fe.upload_modal.upload_success_text,
-                lipidome_output.failures_column_defs,
-                lipidome_output.failures_records,
-                lipidome_output.failures_records,
-            )
-        else:
-            return (
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                fe.upload_modal.upload_failure_text,
-                [],
-                [],
-                [],
-            )
+        return _gen_upload_callback_output(
+            lipidome_output,
+            fe.upload_modal.upload_success_text,
+            fe.upload_modal.upload_failure_text,
+        )
 
     @callback(
         Output(fe.session_download.element_id, "data", allow_duplicate=True),
@@ -351,11 +317,11 @@ def reg_upload_callbacks_python(
             log2fc_filter_model,
         )
 
-        contents: str = session.to_json()
+        contents: bytes = session.to_compressed_json()
 
-        filename: str = "lipidome_projector_session.json"
+        filename: str = "lipidome_projector_session.json.zst"
 
-        return dict(content=contents, filename=filename)
+        return dcc.send_bytes(contents, filename)
 
     @callback(
         Output(fe.mode_selection.element_id, "value", allow_duplicate=True),
@@ -483,69 +449,53 @@ def reg_upload_callbacks_python(
         if contents == "":
             raise PreventUpdate
 
-        # TODO Extract decoding to utils.
         try:
-            session: SessionState = SessionState.from_json(
-                base64.b64decode(contents.split(",")[1]).decode()
+            session: SessionState = SessionState.from_upload_contents(
+                contents
             )
         except Exception as e:  # noqa: F841
             # TODO Extract text to config.
             return (
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
+                *_SESSION_UPLOAD_ERROR_NO_UPDATES,
                 True,
                 "Error while decoding session data.",
             )
 
-        return (
-            session.scatter_cfg.mode,
-            session.scatter_cfg.dim,
-            session.scatter_cfg.sizemode,
-            session.scatter_cfg.scaling_method,
-            session.scatter_cfg.min_max_scaling_value,
-            session.scatter_cfg.linear_scaling_factor,
-            session.scatter_cfg.linear_scaling_base,
-            session.gdc.lipidome_data.records,
-            session.gdc.lipidome_data.virtual_records,
-            session.gdc.lipidome_data.col_groups_defs,
-            session.lipidome_filter_model,
-            session.gdc.lipid_data.records,
-            session.gdc.lipid_data.virtual_records,
-            session.gdc.lipid_data.col_groups_defs,
-            session.lipid_filter_model,
-            session.gdc.difference_data.records,
-            session.gdc.difference_data.virtual_records,
-            session.gdc.difference_data.col_groups_defs,
-            session.gdc.difference_data.selected_rows,
-            session.difference_filter_model,
-            session.gdc.log2fc_data.records,
-            session.gdc.log2fc_data.virtual_records,
-            session.gdc.log2fc_data.col_groups_defs,
-            session.gdc.log2fc_data.selected_rows,
-            session.log2fc_filter_model,
-            no_update,
-            no_update,
-        )
+        return (*session.to_upload_callback_tuple(), no_update, no_update)
+
+
+def _gen_upload_callback_output(
+    lipidome_output: LipidomeUploadResults | LipidomeUploadFailure,
+    upload_success_text: str,
+    upload_failure_text: str,
+) -> tuple:
+    if isinstance(lipidome_output, LipidomeUploadFailure):
+        return (*_UPLOAD_FAILURE_NO_UPDATES, upload_failure_text, [], [], [])
+
+    # Rows and virtual rows of each grid share the same list.
+    results: LipidomeUploadResults = lipidome_output
+    fe_data: LipidomeFrontEndData = results.lipidome_fe_data
+    lipidome_records: list[dict] = fe_data.lipidome_records
+    lipid_records: list[dict] = fe_data.lipid_records
+    difference_records: list[dict] = fe_data.difference_records
+    log2fc_records: list[dict] = fe_data.log2fc_records
+    failures_records: list[dict] = results.failures_records
+
+    return (
+        lipidome_records,
+        lipidome_records,
+        fe_data.lipidome_col_groups_defs,
+        lipid_records,
+        lipid_records,
+        fe_data.lipid_col_groups_defs,
+        difference_records,
+        difference_records,
+        fe_data.difference_col_groups_defs,
+        log2fc_records,
+        log2fc_records,
+        fe_data.log2fc_col_groups_defs,
+        upload_success_text,
+        results.failures_column_defs,
+        failures_records,
+        failures_records,
+    )
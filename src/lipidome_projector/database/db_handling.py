@@ -1,5 +1,7 @@
 """Module concerning the handling of databases."""
 
+import copy
+import functools
 import logging
 import tomllib
 
@@ -11,6 +13,8 @@ from lipidome_projector.database.in_memory_df_db import InMemoryDataFrameDB
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_DB_TYPES: frozenset[str] = frozenset({"in_memory_db_df"})
+
 
 def create_database(config_path: Path) -> BaseDB:
     """Create a database from a configuration.
@@ -27,7 +31,7 @@ def create_database(config_path: Path) -> BaseDB:
             db_config_dict
         )
     else:
-        raise ValueError(f"Unknown database type {type(db_config_dict)}")
+        raise ValueError(f"Unknown database type {db_config_dict['type']}")
 
     return database
 
@@ -35,10 +39,26 @@ def create_database(config_path: Path) -> BaseDB:
 def _load_db_config_dict(config_path: Path) -> dict:
     logger.info("Read database configuration.")
 
-    with open(config_path, "rb") as config_file:
-        config_dict: dict = tomllib.load(config_file)
+    config_dict: dict = _load_db_config_cached(
+        str(config_path.resolve()), config_path.stat().st_mtime_ns
+    )
 
     if "type" not in config_dict:
         raise ValueError("Database configuration must contain a type.")
 
+    if config_dict["type"] not in _DB_TYPES:
+        raise ValueError(f"Unknown database type {config_dict['type']}")
+
+    return copy.deepcopy(config_dict)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_db_config_cached(config_path_str: str, mtime_ns: int) -> dict:
+    # The modification time is part of the cache key so that edits of the
+    # configuration file invalidate the cached entry.
+    with open(config_path_str, "rb") as config_file:
+        config_data: bytes = config_file.read()
+
+    config_dict: dict = tomllib.loads(config_data.decode("utf-8"))
+
     return config_dict
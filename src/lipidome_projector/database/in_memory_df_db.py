@@ -1,13 +1,30 @@
 """Module containing a simple in memory dataframe database class."""
 
+import csv
+import functools
+import hashlib
+import io
 import logging
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+import zipfile
 
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib import metadata
+from importlib.resources import files
 from pathlib import Path
-from typing import Self
+from typing import IO, Self
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from pyarrow import csv as pa_csv, feather
 
 from lipid_data_processing.notation.parsing import ParsedDataset
 
@@ -16,6 +33,33 @@ from lipidome_projector.database.base_db import BaseDB
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Strings are kept in contiguous Arrow buffers, missing values remain NaN.
+_STR_DTYPE: pd.StringDtype = pd.StringDtype("pyarrow", na_value=np.nan)
+# Default missing value strings of the pandas CSV reader.
+_CSV_NULL_VALUES: list[str] = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+_PICKLE_BUFFERS_SUFFIX: str = ".buffers"
+_PICKLE_BUFFER_ALIGNMENT: int = 64
+
 
 @dataclass(frozen=True)
 class InMemoryDataFrameDB(BaseDB):
@@ -25,23 +69,91 @@ class InMemoryDataFrameDB(BaseDB):
     vectors_3d: pd.DataFrame
     smiles: pd.Series
 
-    vectors_combined: pd.DataFrame = field(init=False)
-    matching_ds: ParsedDataset = field(init=False)
-
     @classmethod
     def from_config_dict(cls, config_dict: dict) -> Self:
-        """Create a database from a configuration.
+        """Create a database from a configuration. The database is read
+        from a cache bundle only if a cache directory is configured.
         :param config: The database configuration.
         :returns: The database.
         """
-        return cls.from_files(
+        paths: dict[str, Path] = {
+            path_key: cls._resolve_config_path(config_dict[path_key])
+            for path_key in [
+                "db_path",
+                "vectors_2d_path",
+                "vectors_3d_path",
+                "smiles_path",
+            ]
+        }
+
+        if "cache_dir" not in config_dict:
+            database: Self = cls.from_files(name=config_dict["name"], **paths)
+            # Create the derived data once, before the database is shared
+            # with the upload workers.
+            database._warm()
+
+            return database
+
+        return cls.from_files_cached(
             name=config_dict["name"],
-            db_path=Path(config_dict["db_path"]),
-            vectors_2d_path=Path(config_dict["vectors_2d_path"]),
-            vectors_3d_path=Path(config_dict["vectors_3d_path"]),
-            smiles_path=Path(config_dict["smiles_path"]),
+            **paths,
+            cache_dir=Path(config_dict["cache_dir"]).expanduser(),
         )
 
+    @classmethod
+    def from_files_cached(
+        cls,
+        name: str,
+        db_path: Path,
+        vectors_2d_path: Path,
+        vectors_3d_path: Path,
+        smiles_path: Path,
+        cache_dir: Path,
+    ) -> Self:
+        """Read a database from a cache bundle if one exists for the
+        given files, otherwise read it from the files and create the
+        bundle. Bundles are keyed by the code version and the paths,
+        sizes and modification times of the files, bundles of the same
+        database with other keys are deleted when a new bundle is written.
+        A bundle of the default database takes about 1.5 GB of disk space.
+        :param name: The name of the database.
+        :param db_path: The path to the parsed database.
+        :param vectors_2d_path: The path to the 2D vectors.
+        :param vectors_3d_path: The path to the 3D vectors.
+        :param smiles_path: The path to the SMILES file.
+        :param cache_dir: The directory containing the cache bundles.
+        :returns: The database.
+        """
+        paths: list[Path] = [
+            db_path,
+            vectors_2d_path,
+            vectors_3d_path,
+            smiles_path,
+        ]
+        cache_path: Path = (
+            cache_dir / f"{name}.{cls._gen_cache_key(name, paths)}.pkl"
+        )
+
+        cached_database: Self | None = _read_cache_file(cache_path)
+        if cached_database is not None:
+            return cached_database
+
+        database: Self = cls.from_files(
+            name=name,
+            db_path=db_path,
+            vectors_2d_path=vectors_2d_path,
+            vectors_3d_path=vectors_3d_path,
+            smiles_path=smiles_path,
+        )
+
+        # Include the derived data in the bundle.
+        database._warm()
+
+        _write_cache_file(database, cache_path)
+        _del_stale_cache_files(cache_path, name)
+
+        return database
+
     @classmethod
     def from_files(
         cls,
@@ -59,81 +171,352 @@ class InMemoryDataFrameDB(BaseDB):
         :param smiles_path: The path to the SMILES file.
         :returns: The database.
         """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            db_df_future: Future = executor.submit(
+                cls._read_db_file, db_path, str, False
+            )
+            vectors_2d_future: Future = executor.submit(
+                cls._read_db_file, vectors_2d_path, np.float32
+            )
+            vectors_3d_future: Future = executor.submit(
+                cls._read_db_file, vectors_3d_path, np.float32
+            )
+            smiles_future: Future = executor.submit(
+                cls._read_db_file, smiles_path, str
+            )
+
         return cls(
             name=name,
-            db_df=cls._read_db_file(db_path, str),
-            vectors_2d=cls._read_db_file(vectors_2d_path, float),
-            vectors_3d=cls._read_db_file(vectors_3d_path, float),
-            smiles=cls._read_db_file(smiles_path, str).squeeze(),
+            db_df=db_df_future.result(),
+            vectors_2d=vectors_2d_future.result(),
+            vectors_3d=vectors_3d_future.result(),
+            smiles=smiles_future.result().squeeze(),
         )
 
-    def __post_init__(self) -> None:
-        self._chk_indexes()
-        self._set_combined_vectors()
-        self._set_matching_ds()
+    @staticmethod
+    def _gen_cache_key(name: str, paths: list[Path]) -> str:
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(f"{_get_code_version()}:{name}".encode())
 
-    def _chk_indexes(self) -> None:
-        db_vec2d_sym_diff: pd.Index = self.db_df.index.symmetric_difference(
-            self.vectors_2d.index,
-        )
-        if not db_vec2d_sym_diff.empty:
-            raise ValueError(
-                f"Database and 2D vectors have differing indexes: "
-                f"{db_vec2d_sym_diff}"
+        for path in paths:
+            stat: os.stat_result = path.stat()
+            key_hash.update(
+                f":{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode()
             )
 
-        db_vec3d_sym_diff: pd.Index = self.db_df.index.symmetric_difference(
-            self.vectors_3d.index,
-        )
-        if not db_vec3d_sym_diff.empty:
-            raise ValueError(
-                f"Database and 3D vectors have differing indexes: "
-                f"{db_vec3d_sym_diff}"
-            )
+        return key_hash.hexdigest()
 
-        db_smiles_sym_diff: pd.Index = self.db_df.index.symmetric_difference(
-            self.smiles.index,
-        )
-        if not db_smiles_sym_diff.empty:
-            raise ValueError(
-                f"Database and SMILES have differing indexes: "
-                f"{db_smiles_sym_diff}"
-            )
+    @staticmethod
+    def _resolve_config_path(path_str: str) -> Path:
+        # Relative paths are anchored at the package data directory,
+        # absolute paths are kept.
+        return _get_data_dir() / path_str
+
+    @functools.cached_property
+    def combined_array(self) -> np.ndarray:
+        """Read-only array of the combined 2D and 3D vectors in
+        column-major order, created on first access.
+        """
+        # Concatenating the transposed values yields column-major values,
+        # which keep per-dimension access contiguous. The vectors share
+        # the database index, so no alignment is needed.
+        values: np.ndarray = np.concatenate(
+            [self.vectors_2d.to_numpy().T, self.vectors_3d.to_numpy().T],
+            axis=0,
+        ).T
+        values.flags.writeable = False
 
-    def _set_combined_vectors(self) -> None:
-        vectors_combined: pd.DataFrame = pd.concat(
-            [self.vectors_2d, self.vectors_3d],
-            axis="columns",
-            join="inner",
-            verify_integrity=True,
+        return values
+
+    @functools.cached_property
+    def vectors_combined(self) -> pd.DataFrame:
+        """Combined 2D and 3D vectors, created on first access. The
+        values are shared with the combined array.
+        """
+        return pd.DataFrame(
+            self.combined_array,
+            index=self.db_df.index,
+            columns=self.vectors_2d.columns.append(self.vectors_3d.columns),
+            copy=False,
         )
 
-        object.__setattr__(self, "vectors_combined", vectors_combined)
+    @functools.cached_property
+    def matching_ds(self) -> ParsedDataset:
+        """Dataset of the database lipids used for matching, created on
+        first access.
+        """
+        # The database is read with empty strings instead of missing
+        # values, as expected by the parsed dataset.
+        return ParsedDataset(df=self.db_df).get_component_complete_subset()
+
+    def _warm(self) -> None:
+        # Create the derived data, which is cached on the instance.
+        _ = self.combined_array
+        _ = self.matching_ds
+
+    def __getstate__(self) -> dict:
+        # The combined vectors frame shares its values with the combined
+        # array, it is recreated on access instead of being pickled.
+        state: dict = self.__dict__.copy()
+        state.pop("vectors_combined", None)
+
+        return state
+
+    def __post_init__(self) -> None:
+        self._chk_indexes()
+        self._share_index()
+
+    def _share_index(self) -> None:
+        # All data uses the index object of the database, so that its
+        # lookup table is built only once.
+        index: pd.Index = self.db_df.index
+
+        for attr_name in ["vectors_2d", "vectors_3d", "smiles"]:
+            data: pd.DataFrame | pd.Series = getattr(self, attr_name)
+            if data.index is index:
+                continue
 
-    def _set_matching_ds(self) -> None:
-        matching_ds: ParsedDataset = ParsedDataset(
-            df=self.db_df.fillna("")
-        ).get_component_complete_subset()
+            if data.index.equals(index):
+                # A shallow copy keeps the values without copying them.
+                data = data.copy(deep=False)
+                data.index = index
+            else:
+                data = data.reindex(index)
 
-        object.__setattr__(self, "matching_ds", matching_ds)
+            object.__setattr__(self, attr_name, data)
+
+    def _chk_indexes(self) -> None:
+        self._chk_index_match(self.vectors_2d.index, "2D vectors")
+        self._chk_index_match(self.vectors_3d.index, "3D vectors")
+        self._chk_index_match(self.smiles.index, "SMILES")
+
+    def _chk_index_match(self, other_index: pd.Index, label: str) -> None:
+        if len(self.db_df.index) == len(other_index) and (
+            self.db_df.index.equals(other_index)
+        ):
+            return
+
+        sym_diff: pd.Index = self.db_df.index.symmetric_difference(
+            other_index
+        )
+        if not sym_diff.empty:
+            raise ValueError(
+                f"Database and {label} have differing indexes: {sym_diff}"
+            )
 
     @staticmethod
-    def _read_db_file(path: Path, dtype: type) -> pd.DataFrame:
+    def _read_db_file(
+        path: Path, dtype: type, keep_na: bool = True
+    ) -> pd.DataFrame:
         logger.info(f"Read database file: {path}")
 
-        dtype_dict: defaultdict = defaultdict(lambda: dtype)
-        dtype_dict[0] = str
-
         match filetype := path.suffix:
+            case ".csv" | ".zip" if dtype is str:
+                df: pd.DataFrame = InMemoryDataFrameDB._read_str_csv(path)
             case ".csv" | ".zip":
+                # The values are parsed directly as the requested dtype,
+                # the first column is the index.
                 df: pd.DataFrame = pd.read_csv(
                     path,
                     index_col=0,
-                    dtype=dtype_dict,
+                    dtype=defaultdict(lambda: dtype, {0: str}),
                 )
+            case ".parquet":
+                df: pd.DataFrame = pd.read_parquet(path, engine="pyarrow")
+            case ".feather":
+                # Feather files do not store a pandas index, the first
+                # column is used as index.
+                table: pa.Table = feather.read_table(path, memory_map=True)
+                df: pd.DataFrame = table.to_pandas(
+                    split_blocks=True, self_destruct=True
+                )
+                del table
+                df = df.set_index(df.columns[0])
             case ".pkl":
-                df: pd.DataFrame = pd.read_pickle(path)
+                df: pd.DataFrame = InMemoryDataFrameDB._read_pickle(path)
             case _:
                 raise ValueError(f"Unknown filetype {filetype}")
 
+        if dtype is str:
+            df = df.astype(_STR_DTYPE)
+        else:
+            # Numeric data is kept in a single block, so that extracting
+            # the values does not require consolidation.
+            df = pd.DataFrame(
+                df.to_numpy(dtype=dtype),
+                index=df.index,
+                columns=df.columns,
+                copy=False,
+            )
+
+        if not keep_na and df.isna().any(axis=None):
+            df = df.fillna("")
+
         return df
+
+    @staticmethod
+    def _read_str_csv(path: Path) -> pd.DataFrame:
+        # The Arrow reader parses blocks in parallel, all columns are read
+        # as strings with the missing values of the pandas reader.
+        with InMemoryDataFrameDB._open_csv(path) as csv_file:
+            column_names: list[str] = next(csv.reader(csv_file))
+
+        with InMemoryDataFrameDB._open_csv(path, binary=True) as csv_file:
+            table: pa.Table = pa_csv.read_csv(
+                csv_file,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in column_names},
+                    null_values=_CSV_NULL_VALUES,
+                    strings_can_be_null=True,
+                ),
+            )
+
+        df: pd.DataFrame = table.to_pandas(
+            self_destruct=True, types_mapper={pa.string(): _STR_DTYPE}.get
+        )
+        del table
+
+        return df.set_index(column_names[0])
+
+    @staticmethod
+    def _open_csv(path: Path, binary: bool = False) -> IO:
+        if path.suffix != ".zip":
+            return open(path, "rb") if binary else open(path, newline="")
+
+        with zipfile.ZipFile(path) as zip_file:
+            csv_file: IO[bytes] = zip_file.open(zip_file.namelist()[0])
+
+        return csv_file if binary else io.TextIOWrapper(csv_file, newline="")
+
+    @staticmethod
+    def _read_pickle(path: Path) -> pd.DataFrame:
+        buffers_path: Path = path.with_suffix(_PICKLE_BUFFERS_SUFFIX)
+        if not buffers_path.exists():
+            return pd.read_pickle(path)
+
+        # Out-of-band buffers are memory mapped, so the data is not copied.
+        with open(buffers_path, "rb") as buffers_file:
+            buffers_map: mmap.mmap = mmap.mmap(
+                buffers_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        header: np.ndarray = np.frombuffer(buffers_map, np.uint64, 1)
+        spans: np.ndarray = np.frombuffer(
+            buffers_map, np.uint64, 2 * int(header[0]), 8
+        ).reshape(-1, 2)
+        buffers: list[pickle.PickleBuffer] = [
+            pickle.PickleBuffer(
+                memoryview(buffers_map)[offset : offset + length]
+            )
+            for offset, length in spans.tolist()
+        ]
+
+        with open(path, "rb") as pickle_file:
+            return pickle.load(pickle_file, buffers=buffers)
+
+
+def write_pickle_db_file(df: pd.DataFrame | pd.Series, path: Path) -> None:
+    """Write a database file as a protocol 5 pickle with the data
+    buffers stored out-of-band in a sidecar file, which allows reading
+    the file without copying the data.
+    :param df: The dataframe or series to write.
+    :param path: The path of the pickle file.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    with open(path, "wb") as pickle_file:
+        pickle.dump(
+            df, pickle_file, protocol=5, buffer_callback=buffers.append
+        )
+
+    raw_buffers: list[memoryview] = [buffer.raw() for buffer in buffers]
+
+    offset: int = 8 * (1 + 2 * len(raw_buffers))
+    spans: list[int] = []
+    for raw_buffer in raw_buffers:
+        offset = -(-offset // _PICKLE_BUFFER_ALIGNMENT) * (
+            _PICKLE_BUFFER_ALIGNMENT
+        )
+        spans.extend((offset, raw_buffer.nbytes))
+        offset += raw_buffer.nbytes
+
+    with open(path.with_suffix(_PICKLE_BUFFERS_SUFFIX), "wb") as buffers_file:
+        buffers_file.write(np.array([len(raw_buffers)], np.uint64).tobytes())
+        buffers_file.write(np.array(spans, np.uint64).tobytes())
+        for raw_buffer, buffer_offset in zip(raw_buffers, spans[::2]):
+            buffers_file.write(b"\0" * (buffer_offset - buffers_file.tell()))
+            buffers_file.write(raw_buffer)
+
+
+def _read_cache_file(cache_path: Path) -> object | None:
+    if not cache_path.exists():
+        return None
+
+    logger.info(f"Read cache file: {cache_path}")
+    try:
+        with open(cache_path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        logger.warning(f"Could not read cache file {cache_path}: {e}")
+
+    return None
+
+
+def _write_cache_file(obj: object, cache_path: Path) -> None:
+    # The file is written under a unique temporary name and then moved, so
+    # that concurrent readers never see a partially written file and
+    # concurrent writers do not write to the same file.
+    tmp_cache_path: Path | None = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent,
+            prefix=f"{cache_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as cache_file:
+            tmp_cache_path = Path(cache_file.name)
+            pickle.dump(obj, cache_file, protocol=5)
+        os.replace(tmp_cache_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write cache file {cache_path}: {e}")
+        if tmp_cache_path is not None:
+            tmp_cache_path.unlink(missing_ok=True)
+
+
+def _del_stale_cache_files(cache_path: Path, name: str) -> None:
+    for stale_cache_path in cache_path.parent.glob(f"{name}.*.pkl"):
+        if stale_cache_path == cache_path or (
+            stale_cache_path.name.rsplit(".", 2)[0] != name
+        ):
+            continue
+
+        logger.info(f"Delete stale cache file: {stale_cache_path}")
+        try:
+            stale_cache_path.unlink()
+        except OSError as e:
+            logger.warning(
+                f"Could not delete cache file {stale_cache_path}: {e}"
+            )
+
+
+@functools.cache
+def _get_code_version() -> str:
+    # Bundles are only valid for the code and library versions that
+    # created them.
+    code_hash = hashlib.blake2b(digest_size=16)
+    for distribution_name in ["lipidome-projector", "pandas", "pyarrow"]:
+        try:
+            version: str = metadata.version(distribution_name)
+        except metadata.PackageNotFoundError:
+            version = ""
+        code_hash.update(f"{distribution_name}={version}:".encode())
+
+    for module_name in [__name__, ParsedDataset.__module__]:
+        code_hash.update(Path(sys.modules[module_name].__file__).read_bytes())
+
+    return code_hash.hexdigest()
+
+
+@functools.cache
+def _get_data_dir() -> Path:
+    return Path(os.fspath(files("lipidome_projector.data")))
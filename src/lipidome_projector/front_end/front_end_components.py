@@ -1,15 +1,14 @@
 """Module concerning the front end configuration."""
 
+import functools
 import logging
 
-from abc import ABC, abstractmethod
 from base64 import b64encode
 from dataclasses import dataclass, field
 from importlib.resources import files
+from itertools import pairwise
 from pathlib import Path
-from typing import Literal, Any, Self
-from zlib import decompress
-from datetime import datetime
+from typing import ClassVar, Literal, Any, Self
 
 import dash_ag_grid as dag
 import dash_bootstrap_components as dbc
@@ -25,13 +24,11 @@ from dash import (
     Input,
     State,
     callback,
-    no_update,
-    ctx,
+    ALL,
 )
-from dash._callback import NoUpdate
 from dash.development.base_component import Component
-from dash_split import Split
 from dash.exceptions import PreventUpdate
+from dash_split import Split
 
 from embedding_visualization.colors import rgb_str_to_hex
 
@@ -47,30 +44,57 @@ logger: logging.Logger = logging.getLogger(__name__)
 # COMMON BASE COMPONENT CLASSES -----------------------------------------------
 
 
-@dataclass(frozen=True, kw_only=True)
-class ComponentWrapper(ABC):
+@functools.cache
+def _get_empty_plot_dict() -> dict:
+    # Shared by all initially empty graphs, must not be mutated.
+    return gen_empty_plot().to_dict()
+
+
+def _gen_row(*column_children: Component) -> dbc.Row:
+    return dbc.Row([dbc.Col(child) for child in column_children])
+
+
+# Wrappers are compared and hashed by identity, which is constant time and
+# also works for wrappers holding unhashable values. They are not frozen, as
+# frozen construction is several times slower, but their fields must not be
+# mutated once initialized.
+@dataclass(kw_only=True, slots=True, eq=False)
+class ComponentWrapper:
     element_id: str
     frame_title: str | None = None
 
+    _component: Component | None = field(
+        default=None, init=False, repr=False
+    )
+
     def get_component(self, *args, **kwargs) -> Component:
-        component: Component = self.gen_component(*args, **kwargs)
+        # Components generated without arguments only depend on the fields
+        # and are therefore generated once per wrapper.
+        if args or kwargs:
+            return self._gen_framed_component(*args, **kwargs)
 
-        if self.frame_title is not None:
-            component = self.frame_component(component)
+        if self._component is None:
+            self._component = self._gen_framed_component()
 
-        return component
+        return self._component
+
+    def _gen_framed_component(self, *args, **kwargs) -> Component:
+        if self.frame_title is None:
+            return self.gen_component(*args, **kwargs)
 
-    def frame_component(self, component: Component) -> Component:
         return html.Fieldset(
             className="fieldset",
-            children=[html.Legend(self.frame_title), component],
+            children=[
+                html.Legend(self.frame_title),
+                self.gen_component(*args, **kwargs),
+            ],
         )
 
-    @abstractmethod
-    def gen_component(self, *args, **kwargs) -> Component: ...
+    def gen_component(self, *args, **kwargs) -> Component:
+        raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class Button(ComponentWrapper):
     element_id: str
     text: str
@@ -84,7 +108,7 @@ class Button(ComponentWrapper):
         return button
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class FullscreenButton(ComponentWrapper):
     element_id: str
 
@@ -98,91 +122,102 @@ class FullscreenButton(ComponentWrapper):
         return fullscreen_button
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class Graph(ComponentWrapper):
     element_id: str
 
+    # Shared by all graphs, must not be mutated.
+    _CONFIG: ClassVar[dict] = {
+        "editable": True,
+        "edits": {
+            "annotationPosition": False,
+            "annotationTail": True,
+            "annotationText": True,
+            "axisTitleText": False,
+            "colorbarPosition": False,
+            "colorbarTitleText": False,
+            "legendPosition": True,
+            "legendText": False,
+            "shapePosition": True,
+            "titleText": False,
+        },
+        "displaylogo": False,
+        "toImageButtonOptions": {
+            "format": "svg",
+            "height": 800,
+            "width": 800,
+            "scale": 1,
+        },
+    }
+    _STYLE: ClassVar[dict[str, str]] = {"height": "100%"}
+
     def gen_component(self):
         graph = dcc.Graph(
             id=self.element_id,
             responsive=True,
-            figure=gen_empty_plot(),
-            config={
-                "editable": True,
-                "edits": {
-                    "annotationPosition": False,
-                    "annotationTail": True,
-                    "annotationText": True,
-                    "axisTitleText": False,
-                    "colorbarPosition": False,
-                    "colorbarTitleText": False,
-                    "legendPosition": True,
-                    "legendText": False,
-                    "shapePosition": True,
-                    "titleText": False,
-                },
-                "displaylogo": False,
-                "toImageButtonOptions": {
-                    "format": "svg",
-                    "height": 800,
-                    "width": 800,
-                    "scale": 1,
-                },
-            },
-            style={"height": "100%"},
+            figure=_get_empty_plot_dict(),
+            config=self._CONFIG,
+            style=self._STYLE,
         )
 
         return graph
 
 
-@dataclass(frozen=True)
+@functools.cache
+def _get_row_id_expr(row_id_col_name: str | None) -> str | None:
+    return f"params.data.{row_id_col_name}" if row_id_col_name else None
+
+
+@dataclass(slots=True, eq=False)
 class Grid(ComponentWrapper):
     element_id: str
 
-    def gen_component(self, row_id_col_name: str | None = None) -> dag.AgGrid:
-        row_id: str | None = (
-            f"params.data.{row_id_col_name}" if row_id_col_name else None
-        )
+    _GRID_OPTIONS: ClassVar[dict[str, str]] = {"rowSelection": "multiple"}
+    _STYLE: ClassVar[dict[str, str]] = {"height": "100%"}
+    _CLASS_NAME: ClassVar[str] = "ag-theme-alpine compact"
 
+    def gen_component(self, row_id_col_name: str | None = None) -> dag.AgGrid:
         grid: dag.AgGrid = dag.AgGrid(
             id=self.element_id,
-            dashGridOptions={"rowSelection": "multiple"},
-            getRowId=row_id,
-            style={"height": "100%"},
-            className="ag-theme-alpine compact",
+            dashGridOptions=self._GRID_OPTIONS,
+            getRowId=_get_row_id_expr(row_id_col_name),
+            style=self._STYLE,
+            className=self._CLASS_NAME,
         )
 
         return grid
 
 
-@dataclass(frozen=True)
+# Style of the upload fields, shared by the lipidome and session uploads.
+_UPLOAD_STYLE: dict[str, str] = {
+    "width": "50%",
+    "height": "40px",
+    "lineHeight": "20px",
+    "borderWidth": "1px",
+    "borderStyle": "dashed",
+    "borderRadius": "5px",
+    "textAlign": "center",
+    "margin": "10px",
+}
+
+
+@dataclass(slots=True, eq=False)
 class UploadComponent(ComponentWrapper):
     element_id: str
     text: str
 
     def gen_component(self) -> dcc.Upload:
-        style: dict[str, str] = {
-            "width": "50%",
-            "height": "40px",
-            "lineHeight": "20px",
-            "borderWidth": "1px",
-            "borderStyle": "dashed",
-            "borderRadius": "5px",
-            "textAlign": "center",
-            "margin": "10px",
-        }
-
         upload_component: dcc.Upload = dcc.Upload(
             id=self.element_id,
             children=html.Div([html.A(self.text)]),
-            style=style,
+            style=_UPLOAD_STYLE,
             multiple=False,
         )
 
         return upload_component
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class Tooltip(ComponentWrapper):
     element_id: str
     placement: str
@@ -196,14 +231,14 @@ class Tooltip(ComponentWrapper):
         return tooltip
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class TriggerDiv(ComponentWrapper):
     element_id: str
 
+    _STYLE: ClassVar[dict[str, str]] = {"display": "none"}
+
     def gen_component(self) -> html.Div:
-        trigger_div: html.Div = html.Div(
-            id=self.element_id, style={"display": "none"}
-        )
+        trigger_div: html.Div = html.Div(id=self.element_id, style=self._STYLE)
 
         return trigger_div
 
@@ -214,7 +249,7 @@ class TriggerDiv(ComponentWrapper):
 # -- MISC. COMPONENTS ---------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class PreventFigureRefresh(TriggerDiv):
     element_id: str = "prevent-figure-refresh"
 
@@ -249,7 +284,7 @@ class SplitHorizontal(Split):
         return split
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class FullScreenSizeStore(ComponentWrapper):
     element_id: str = "fullscreen-size-store"
 
@@ -261,25 +296,18 @@ class FullScreenSizeStore(ComponentWrapper):
 
         return store
 
-    def __post_init__(self):
+    def register_callback(self) -> None:
         clientside_callback(
-            """
-            function(data) {
-                if(data === null) {
-                    return dash_clientside.no_update;
-                }
-                var width = window.innerWidth || document.documentElement.clientWidth || document.body.clientWidth;
-                var height = window.innerHeight || document.documentElement.clientHeight || document.body.clientHeight;
-                return {
-                    'width': width - 150, 'height': height - 150
-                };
-            }
-            """,  # noqa: E501
+            ClientsideFunction(
+                namespace="clientside", function_name="update_fullscreen_size"
+            ),
             Output(self.element_id, "data"),
             Input(self.element_id, "data"),
+            prevent_initial_call=True,
         )
 
 
+@dataclass(slots=True, eq=False)
 class FullscreenModal(ComponentWrapper):
     element_id: str
     content_type: type[Component]
@@ -287,25 +315,27 @@ class FullscreenModal(ComponentWrapper):
     title: str = ""
     is_open: bool = False
 
+    _GRAPH_CONFIG: ClassVar[dict] = {
+        "displaylogo": False,
+        "toImageButtonOptions": {
+            "format": "svg",
+            "width": 800,
+            "height": 800,
+        },
+    }
+    _CONTENT_STYLE: ClassVar[dict[str, str]] = {"height": "100%"}
+
     def gen_component(self) -> dbc.Modal:
         if self.content_type == dcc.Graph:
             modal_content = self.content_type(
                 id=self.content_id,
                 responsive=True,
-                figure=gen_empty_plot(),
-                config={
-                    "displaylogo": False,
-                    "toImageButtonOptions": {
-                        "format": "svg",
-                        "width": 800,
-                        "height": 800,
-                    },
-                },
-                style={"height": "100%"},
+                config=self._GRAPH_CONFIG,
+                style=self._CONTENT_STYLE,
             )
         else:
             modal_content = self.content_type(
-                id=self.content_id, style={"height": "100%"}
+                id=self.content_id, style=self._CONTENT_STYLE
             )
         fullscreen_modal: dbc.Modal = dbc.Modal(
             [
@@ -320,7 +350,7 @@ class FullscreenModal(ComponentWrapper):
         return fullscreen_modal
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class FullScreenModalAbundanceGraph(FullscreenModal):
     element_id: str = "fullscreen-modal-abundance-graph"
     content_id: str = "fullscreen-modal-abundance-graph-body"
@@ -328,7 +358,7 @@ class FullScreenModalAbundanceGraph(FullscreenModal):
     title: str = "Abundance Graph"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class FullScreenModalLipidomeGraph(FullscreenModal):
     element_id: str = "fullscreen-modal-lipidome-graph"
     content_id: str = "fullscreen-modal-lipidome-graph-body"
@@ -336,7 +366,7 @@ class FullScreenModalLipidomeGraph(FullscreenModal):
     title: str = "Lipidome Graph"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class FullScreenModalStructureImage(FullscreenModal):
     element_id: str = "fullscreen-modal-structure-image"
     content_id: str = "fullscreen-modal-structure-image-body"
@@ -344,7 +374,7 @@ class FullScreenModalStructureImage(FullscreenModal):
     title: str = "Chemical Structure"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class TestWarning(ComponentWrapper):
     element_id: str = "test-warning"
     title: str = "Warning"
@@ -372,7 +402,7 @@ class TestWarning(ComponentWrapper):
         return test_warning_modal
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class ProblemModal(ComponentWrapper):
     element_id: str = "problem-modal"
     body_id: str = "problem-modal-body"
@@ -393,17 +423,12 @@ class ProblemModal(ComponentWrapper):
 
         return problem_modal
 
-    def __post_init__(self):
+    def register_callback(self) -> None:
         clientside_callback(
-            """
-            function (is_open, body_children) {
-                if (is_open) {
-                    return body_children;
-                } else {
-                    return "";
-                }
-            }
-            """,
+            ClientsideFunction(
+                namespace="clientside",
+                function_name="show_problem_modal_body",
+            ),
             Output(self.body_id, "children", allow_duplicate=True),
             Input(self.element_id, "is_open"),
             State(self.body_id, "children"),
@@ -411,7 +436,7 @@ class ProblemModal(ComponentWrapper):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class StoreInit(ComponentWrapper):
     element_id: str = "store-init"
 
@@ -424,27 +449,34 @@ class StoreInit(ComponentWrapper):
 # -- GRAPH RELATED COMPONENTS -------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class LipidomeGraph(Graph):
     element_id: str = "lipidome-graph"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class LipidomeGraphFullscreenButton(FullscreenButton):
     element_id: str = "lipid-graph-fullscreen-button"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class AbundanceGraph(Graph):
     element_id: str = "abundance-graph"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class AbundanceGraphFullscreenButton(FullscreenButton):
     element_id: str = "abundance-graph-fullscreen-button"
 
 
-@dataclass(frozen=True)
+@functools.cache
+def _get_png_data_uri(image_path: Path) -> str:
+    encoded_image: str = b64encode(image_path.read_bytes()).decode("ascii")
+
+    return f"data:image/png;base64,{encoded_image}"
+
+
+@dataclass(slots=True, eq=False)
 class StructureImage(ComponentWrapper):
     element_id: str = "structure-image"
     default_image_path: Path = (
@@ -452,11 +484,8 @@ class StructureImage(ComponentWrapper):
     )
 
     def gen_component(self) -> html.Img:
-        encoded_image = b64encode(
-            open(self.default_image_path, "rb").read()
-        ).decode("ascii")
         image: html.Img = html.Img(
-            src="data:image/png;base64,{}".format(encoded_image),
+            src=_get_png_data_uri(self.default_image_path),
             style={"height": "50%", "width": "50%"},
             id=self.element_id,
         )
@@ -464,7 +493,7 @@ class StructureImage(ComponentWrapper):
         return image
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class StructureImageFullscreenButton(FullscreenButton):
     element_id: str = "structure-image-fullscreen-button"
 
@@ -472,27 +501,46 @@ class StructureImageFullscreenButton(FullscreenButton):
 # -- GRID RELATED COMPONENTS --------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class LipidomeGrid(Grid):
     element_id: str = "lipidome-grid"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class LipidGrid(Grid):
     element_id: str = "lipid-grid"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class DifferenceGrid(Grid):
     element_id: str = "difference-grid"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class Log2FCGrid(Grid):
     element_id: str = "log2fc-grid"
 
 
-@dataclass(frozen=True)
+def _gen_change_subtabs(
+    difference_grid: dag.AgGrid,
+    log2fc_grid: dag.AgGrid,
+    tabs_id: str,
+    difference_tab_kwargs: dict[str, str],
+    log2fc_tab_kwargs: dict[str, str],
+) -> dcc.Tabs:
+    change_subtabs: dcc.Tabs = dcc.Tabs(
+        [
+            dcc.Tab([difference_grid], **difference_tab_kwargs),
+            dcc.Tab([log2fc_grid], **log2fc_tab_kwargs),
+        ],
+        id=tabs_id,
+        value=difference_tab_kwargs["value"],
+    )
+
+    return change_subtabs
+
+
+@dataclass(slots=True, eq=False)
 class GridTabs(ComponentWrapper):
     element_id: str = "grid-tabs"
     lipidome_tab_title: str = "Lipidomes"
@@ -503,6 +551,15 @@ class GridTabs(ComponentWrapper):
     lipid_tab_name: str = "lipid"
     change_tab_name: str = "change"
 
+    _DIFFERENCE_TAB_KWARGS: ClassVar[dict[str, str]] = {
+        "label": "Difference",
+        "value": "difference",
+    }
+    _LOG2FC_TAB_KWARGS: ClassVar[dict[str, str]] = {
+        "label": "Log2FC",
+        "value": "log2fc",
+    }
+
     def gen_component(
         self,
         lipidome_grid: dag.AgGrid,
@@ -510,6 +567,13 @@ class GridTabs(ComponentWrapper):
         difference_grid: dag.AgGrid,
         log2fc_grid: dag.AgGrid,
     ) -> dcc.Tabs:
+        change_subtabs: dcc.Tabs = _gen_change_subtabs(
+            difference_grid,
+            log2fc_grid,
+            self.change_tabs_id,
+            self._DIFFERENCE_TAB_KWARGS,
+            self._LOG2FC_TAB_KWARGS,
+        )
         tabs: dcc.Tabs = dcc.Tabs(
             [
                 dcc.Tab(
@@ -523,24 +587,7 @@ class GridTabs(ComponentWrapper):
                     value=self.lipid_tab_name,
                 ),
                 dcc.Tab(
-                    [
-                        dcc.Tabs(
-                            [
-                                dcc.Tab(
-                                    [difference_grid],
-                                    label="Difference",
-                                    value="difference",
-                                ),
-                                dcc.Tab(
-                                    [log2fc_grid],
-                                    label="Log2FC",
-                                    value="log2fc",
-                                ),
-                            ],
-                            id=self.change_tabs_id,
-                            value="difference",
-                        ),
-                    ],
+                    [change_subtabs],
                     label=self.change_tab_title,
                     value=self.change_tab_name,
                 ),
@@ -555,7 +602,17 @@ class GridTabs(ComponentWrapper):
 # -- SETTINGS RELATED COMPONENTS ----------------------------------------------
 
 
-@dataclass(frozen=True)
+def _gen_accordion_item(
+    item_id: str, title: str, children: Component | list[Component]
+) -> dbc.AccordionItem:
+    accordion_item: dbc.AccordionItem = dbc.AccordionItem(
+        children, id=item_id, title=title, item_id=item_id
+    )
+
+    return accordion_item
+
+
+@dataclass(slots=True, eq=False)
 class SettingsAccordion(ComponentWrapper):
     element_id: str = "settings-accordion"
     data_setup_title: str = "Data Setup"
@@ -573,6 +630,8 @@ class SettingsAccordion(ComponentWrapper):
     manual_title: str = "Manual"
     manual_id: str = "manual"
 
+    _RELATIVE_STYLE: ClassVar[dict[str, str]] = {"position": "relative"}
+
     def gen_component(
         self,
         upload_setup_button: Component,
@@ -598,7 +657,9 @@ class SettingsAccordion(ComponentWrapper):
     ) -> dbc.Accordion:
         settings_accordion: dbc.Accordion = dbc.Accordion(
             [
-                dbc.AccordionItem(
+                _gen_accordion_item(
+                    self.data_setup_id,
+                    self.data_setup_title,
                     [
                         upload_setup_button,
                         html.Br(),
@@ -607,11 +668,10 @@ class SettingsAccordion(ComponentWrapper):
                         session_download,
                         html.Br(),
                     ],
-                    id=self.data_setup_id,
-                    title=self.data_setup_title,
-                    item_id=self.data_setup_id,
                 ),
-                dbc.AccordionItem(
+                _gen_accordion_item(
+                    self.graph_settings_id,
+                    self.graph_settings_title,
                     [
                         mode_selection_div,
                         dimensionality_selection_div,
@@ -619,11 +679,10 @@ class SettingsAccordion(ComponentWrapper):
                         scaling,
                         figure_download_settings,
                     ],
-                    id=self.graph_settings_id,
-                    title=self.graph_settings_title,
-                    item_id=self.graph_settings_id,
                 ),
-                dbc.AccordionItem(
+                _gen_accordion_item(
+                    self.data_operations_id,
+                    self.data_operations_title,
                     [
                         grouping_component,
                         change_component,
@@ -631,43 +690,32 @@ class SettingsAccordion(ComponentWrapper):
                         set_color_component,
                         delete_component,
                     ],
-                    id=self.data_operations_id,
-                    title=self.data_operations_title,
-                    item_id=self.data_operations_id,
                 ),
-                dbc.AccordionItem(
-                    children=html.Div(
+                _gen_accordion_item(
+                    self.abundance_chart_id,
+                    self.abundance_chart_title,
+                    html.Div(
                         [abundance_graph_fullscreen_button, abundance_graph],
-                        style={"position": "relative"},
+                        style=self._RELATIVE_STYLE,
                     ),
-                    id=self.abundance_chart_id,
-                    title=self.abundance_chart_title,
-                    item_id=self.abundance_chart_id,
                 ),
-                dbc.AccordionItem(
-                    children=html.Div(
+                _gen_accordion_item(
+                    self.structure_id,
+                    self.structure_title,
+                    html.Div(
                         [structure_image_fullscreen_button, structure_image],
-                        style={"position": "relative"},
+                        style=self._RELATIVE_STYLE,
                     ),
-                    id=self.structure_id,
-                    title=self.structure_title,
-                    item_id=self.structure_id,
                 ),
-                dbc.AccordionItem(
-                    children=html.Div(
-                        [theme_switch, about_button],
-                    ),
-                    id=self.app_settings_id,
-                    title=self.app_settings_title,
-                    item_id=self.app_settings_id,
+                _gen_accordion_item(
+                    self.app_settings_id,
+                    self.app_settings_title,
+                    html.Div([theme_switch, about_button]),
                 ),
-                dbc.AccordionItem(
-                    children=html.Div(
-                        [manual_tour_component],
-                    ),
-                    id=self.manual_id,
-                    title=self.manual_title,
-                    item_id=self.manual_id,
+                _gen_accordion_item(
+                    self.manual_id,
+                    self.manual_title,
+                    html.Div([manual_tour_component]),
                 ),
             ],
             always_open=True,
@@ -681,13 +729,18 @@ class SettingsAccordion(ComponentWrapper):
 # -- DATA SETUP COMPONENTS ----------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class DefaultDatasetButton(Button):
     element_id: str = "default-dataset-button"
     text: str = "Load Default Dataset"
 
 
-@dataclass(frozen=True)
+@functools.cache
+def _get_dropdown_options(values: tuple[str, ...]) -> list[dict[str, str]]:
+    return [{"label": value, "value": value} for value in values]
+
+
+@dataclass(slots=True, eq=False)
 class DefaultDatasetModal(ComponentWrapper):
     element_id: str = "default-dataset-modal"
     selection_dropdown_element_id: str = "default-dataset-selection-dropdown"
@@ -700,10 +753,7 @@ class DefaultDatasetModal(ComponentWrapper):
         initial_dataset: str = next(iter(dataset_descriptions.keys()))
 
         default_dataset_selection_dropdown: dcc.Dropdown = dcc.Dropdown(
-            options=[
-                {"label": dataset, "value": dataset}
-                for dataset in dataset_descriptions.keys()
-            ],
+            options=_get_dropdown_options(tuple(dataset_descriptions)),
             value=initial_dataset,
             id=self.selection_dropdown_element_id,
             clearable=False,
@@ -737,43 +787,43 @@ class DefaultDatasetModal(ComponentWrapper):
         return default_dataset_modal
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class UploadSetupButton(Button):
     element_id: str = "upload-setup-button"
     text: str = "Dataset Upload Setup"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class UploadAbundances(UploadComponent):
     element_id: str = "upload-abundances"
     text: str = "Upload Abundances"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class UploadLipidomeFeatures(UploadComponent):
     element_id: str = "upload-lipidome-features"
     text: str = "Upload Lipidome Features"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class UploadFAConstraints(UploadComponent):
     element_id: str = "upload-fa-constraints"
     text: str = "Upload FA Constraints"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class UploadLCBConstraints(UploadComponent):
     element_id: str = "upload-lcb-constraints"
     text: str = "Upload LCB Constraints"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class UploadInitiateButton(Button):
     element_id: str = "upload-initiate-button"
     text: str = "Upload Data"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class UploadFailuresGrid(Grid):
     element_id: str = "upload-failures-grid"
 
@@ -785,9 +835,10 @@ class UploadFailuresGrid(Grid):
         return grid
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class UploadModal(ComponentWrapper):
     element_id: str = "upload-modal"
+    progress_text_element_id: str = "upload-modal-progress-text"
     footer_text_element_id: str = "upload-modal-footer-text"
     title: str = "Upload Lipidome Dataset"
     upload_success_text: str = (
@@ -818,6 +869,9 @@ class UploadModal(ComponentWrapper):
                         upload_lcb_constraints,
                         upload_initiate_button,
                         html.Hr(),
+                        html.Div(
+                            id=self.progress_text_element_id, hidden=True
+                        ),
                         html.Div(id=self.footer_text_element_id),
                         html.Div([upload_failures_grid]),
                     ]
@@ -834,7 +888,16 @@ class UploadModal(ComponentWrapper):
 # -- GRAPH SETTINGS COMPONENTS ------------------------------------------------
 
 
-@dataclass(frozen=True)
+@functools.cache
+def _get_radio_options(
+    *label_value_pairs: tuple[str, Any],
+) -> list[dict[str, Any]]:
+    return [
+        {"label": label, "value": value} for label, value in label_value_pairs
+    ]
+
+
+@dataclass(slots=True, eq=False)
 class ModeSelection(ComponentWrapper):
     element_id: str = "mode-selection"
     frame_title: str = "Mode"
@@ -847,20 +910,11 @@ class ModeSelection(ComponentWrapper):
 
     def gen_component(self) -> dbc.RadioItems:
         mode_radio_items: dbc.RadioItems = dbc.RadioItems(
-            options=[
-                {
-                    "label": self.option_lipidome_overlay,
-                    "value": self.value_lipidome_overlay,
-                },
-                {
-                    "label": self.option_pair_difference,
-                    "value": self.value_pair_difference,
-                },
-                {
-                    "label": self.option_pair_log2fc,
-                    "value": self.value_pair_log2fc,
-                },
-            ],
+            options=_get_radio_options(
+                (self.option_lipidome_overlay, self.value_lipidome_overlay),
+                (self.option_pair_difference, self.value_pair_difference),
+                (self.option_pair_log2fc, self.value_pair_log2fc),
+            ),
             value="overlay",
             inline=True,
             id=self.element_id,
@@ -869,7 +923,7 @@ class ModeSelection(ComponentWrapper):
         return mode_radio_items
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class DimensionalitySelection(ComponentWrapper):
     element_id: str = "dimensionality-selection"
     frame_title: str = "Dimensionality"
@@ -878,10 +932,7 @@ class DimensionalitySelection(ComponentWrapper):
 
     def gen_component(self) -> html.Div:
         dimensionality_radio_items: dbc.RadioItems = dbc.RadioItems(
-            options=[
-                {"label": self.option2d, "value": 2},
-                {"label": self.option3d, "value": 3},
-            ],
+            options=_get_radio_options((self.option2d, 2), (self.option3d, 3)),
             value=2,
             inline=True,
             id=self.element_id,
@@ -894,7 +945,7 @@ class DimensionalitySelection(ComponentWrapper):
         return dimensionality_selection_div
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class SizeModeSelection(ComponentWrapper):
     element_id: str = "size-mode-selection"
     frame_title: str = "Size Mode"
@@ -905,16 +956,10 @@ class SizeModeSelection(ComponentWrapper):
 
     def gen_component(self) -> html.Div:
         sizemode_radio_items: dbc.RadioItems = dbc.RadioItems(
-            options=[
-                {
-                    "label": self.option_area,
-                    "value": self.value_area,
-                },
-                {
-                    "label": self.option_diameter,
-                    "value": self.value_diameter,
-                },
-            ],
+            options=_get_radio_options(
+                (self.option_area, self.value_area),
+                (self.option_diameter, self.value_diameter),
+            ),
             value="area",
             inline=True,
             id=self.element_id,
@@ -925,7 +970,7 @@ class SizeModeSelection(ComponentWrapper):
         return sizemode_div
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class LinearScaling(ComponentWrapper):
     element_id: str = "linear-scaling"
     factor_element_id: str = "linear-scaling-factor"
@@ -980,7 +1025,7 @@ class LinearScaling(ComponentWrapper):
         return div
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class MinMaxScaling(ComponentWrapper):
     element_id: str = "min-max-scaling"
 
@@ -1007,7 +1052,16 @@ class MinMaxScaling(ComponentWrapper):
         return div
 
 
-@dataclass(frozen=True)
+_DOWNLOAD_LABELS: dict[str, str] = {
+    "height": "Height",
+    "width": "Width",
+    "scale": "Scale Factor",
+    "name": "File Name",
+    "file_type": "File Type",
+}
+
+
+@dataclass(slots=True, eq=False)
 class FigureDownloadSettings(ComponentWrapper):
     element_id: str = "figure download settings"
     frame_title: str = "Figure download settings"
@@ -1060,26 +1114,23 @@ class FigureDownloadSettings(ComponentWrapper):
         )
 
         download_label = html.Label(self.label_text)
-        ftype_label = html.Label("File Type")
-        name_label = html.Label("File Name")
-        height_input_label = html.Label("Height")
-        width_input_label = html.Label("Width")
-        scale_input_label = html.Label("Scale Factor")
 
         return dbc.Container(
             children=[
                 dbc.Row(download_label),
-                dbc.Row([dbc.Col(height_input_label), dbc.Col(height_input)]),
-                dbc.Row([dbc.Col(width_input_label), dbc.Col(width_input)]),
-                dbc.Row([dbc.Col(scale_input_label), dbc.Col(scale_input)]),
-                dbc.Row([dbc.Col(name_label), dbc.Col(name_input)]),
-                dbc.Row([dbc.Col(ftype_label), dbc.Col(type_dropdown)]),
+                _gen_row(html.Label(_DOWNLOAD_LABELS["height"]), height_input),
+                _gen_row(html.Label(_DOWNLOAD_LABELS["width"]), width_input),
+                _gen_row(html.Label(_DOWNLOAD_LABELS["scale"]), scale_input),
+                _gen_row(html.Label(_DOWNLOAD_LABELS["name"]), name_input),
+                _gen_row(
+                    html.Label(_DOWNLOAD_LABELS["file_type"]), type_dropdown
+                ),
             ],
             id=self.element_id,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class Scaling(ComponentWrapper):
     element_id: str = "scaling"
     frame_title: str = "Scaling"
@@ -1112,7 +1163,7 @@ class Scaling(ComponentWrapper):
 # -- DATA OPERATIONS COMPONENTS -----------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class GroupingComponent(ComponentWrapper):
     element_id: str = "grouping"
     frame_title: str = "Grouping"
@@ -1160,7 +1211,7 @@ class GroupingComponent(ComponentWrapper):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class ChangeComponent(ComponentWrapper):
     element_id: str = "change-component"
     frame_title: str = "Pairwise Changes"
@@ -1190,7 +1241,7 @@ class ChangeComponent(ComponentWrapper):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class LastDeletedStore(ComponentWrapper):
     element_id: str = "last-deleted-store"
 
@@ -1200,7 +1251,7 @@ class LastDeletedStore(ComponentWrapper):
         return store
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class DeleteComponent(ComponentWrapper):
     element_id: str = "delete-component"
     frame_title: str = "Delete Lipidomes"
@@ -1223,12 +1274,10 @@ class DeleteComponent(ComponentWrapper):
             disabled=True,
         )
 
-        return html.Div(
-            dbc.Row([dbc.Col(delete_button), dbc.Col(undo_delete_button)])
-        )
+        return html.Div(_gen_row(delete_button, undo_delete_button))
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class SetNameComponent(ComponentWrapper):
     element_id: str = "set-name-div"
     frame_title: str = "Set Name"
@@ -1247,14 +1296,67 @@ class SetNameComponent(ComponentWrapper):
         )
 
         div: html.Div = html.Div(
-            dbc.Row([dbc.Col(set_name_button), dbc.Col(set_name_input)]),
+            _gen_row(set_name_button, set_name_input),
             id=self.element_id,
         )
 
         return div
 
 
-@dataclass(frozen=True)
+def _generate_color_scale_divs(
+    color_scale_name: str, colors: list[str]
+) -> list[html.Div]:
+    colors: list[str] = [
+        color if color.startswith("#") else rgb_str_to_hex(color)
+        for color in colors
+    ]
+    color_div_list = [
+        html.Div(
+            children=color_scale_name,
+            style={
+                "fontWeight": "bold",
+                "marginRight": "10px",
+                "width": "150px",
+                "textOverflow": "ellipsis",
+                "overflow": "hidden",
+                "whiteSpace": "nowrap",
+            },
+        )
+    ]
+    color_div_list.extend(
+        [
+            html.Div(
+                style={
+                    "backgroundColor": color,
+                    "height": "20px",
+                    "width": "20px",
+                }
+            )
+            for color in colors
+        ]
+    )
+    return color_div_list
+
+
+@functools.cache
+def _get_color_scales() -> list[dict[str, Any]]:
+    # Shared by all color scale dropdowns, must not be mutated.
+    color_scales = []
+
+    for trace in px.colors.qualitative.swatches().data:
+        colors = trace.marker.color
+        color_scale_name = trace.y[0]
+        color_scales.append(
+            {
+                "label": _generate_color_scale_divs(color_scale_name, colors),
+                "value": color_scale_name,
+            }
+        )
+
+    return color_scales
+
+
+@dataclass(slots=True, eq=False)
 class SetColorComponent(ComponentWrapper):
     element_id: str = "color-component"
     frame_title: str = "Color Settings"
@@ -1266,21 +1368,18 @@ class SetColorComponent(ComponentWrapper):
     color_scale_button_text: str = "Change Color Scale"
     color_scale_dropdown_id: str = "change-color-scale-dropdown"
     color_scale_dropdown_value: str = "Viridis"
+    color_scale_dropdown_div_id: str = "change-color-scale-dropdown-div"
+    color_scale_options_request_id: str = "change-color-scale-options-request"
 
     def gen_component(self) -> html.Div:
         return html.Div(
             [
-                dbc.Row(
-                    [
-                        dbc.Col(self.gen_set_color_button()),
-                        dbc.Col(self.gen_set_color_picker()),
-                    ]
+                _gen_row(
+                    self.gen_set_color_button(), self.gen_set_color_picker()
                 ),
-                dbc.Row(
-                    [
-                        dbc.Col(self.gen_color_scale_button()),
-                        dbc.Col(self.gen_color_scale_dropdown()),
-                    ]
+                _gen_row(
+                    self.gen_color_scale_button(),
+                    self.gen_color_scale_dropdown(),
                 ),
             ]
         )
@@ -1302,71 +1401,47 @@ class SetColorComponent(ComponentWrapper):
             self.color_scale_button_text, id=self.color_scale_button_id
         )
 
-    def gen_color_scale_dropdown(self) -> dcc.Dropdown:
-
-        def _generate_color_scale_divs(
-            color_scale_name: str, colors: list[str]
-        ) -> list[html.Div]:
-            colors: list[str] = [
-                color if color.startswith("#") else rgb_str_to_hex(color)
-                for color in colors
-            ]
-            color_div_list = [
-                html.Div(
-                    children=color_scale_name,
-                    style={
-                        "fontWeight": "bold",
-                        "marginRight": "10px",
-                        "width": "150px",
-                        "textOverflow": "ellipsis",
-                        "overflow": "hidden",
-                        "whiteSpace": "nowrap",
-                    },
-                )
-            ]
-            color_div_list.extend(
-                [
-                    html.Div(
-                        style={
-                            "backgroundColor": color,
-                            "height": "20px",
-                            "width": "20px",
-                        }
-                    )
-                    for color in colors
-                ]
-            )
-            return color_div_list
-
-        def _get_color_scales():
-            color_scale_dict = px.colors.qualitative.swatches().to_dict()
-            color_scales = []
-
-            for trace in color_scale_dict["data"]:
-                colors = trace.get("marker").get("color")
-                color_scale_name = trace.get("y")[0]
-                color_scales.append(
-                    {
-                        "label": _generate_color_scale_divs(
-                            color_scale_name, colors
-                        ),
-                        "value": color_scale_name,
-                    }
-                )
+    def gen_color_scale_dropdown(self) -> html.Div:
+        # The options are loaded on the first interaction with the dropdown,
+        # which keeps the swatches out of the initial layout.
+        return html.Div(
+            [
+                dcc.Dropdown(
+                    id=self.color_scale_dropdown_id,
+                    options=[],
+                    value=self.color_scale_dropdown_value,
+                ),
+                dcc.Store(id=self.color_scale_options_request_id),
+            ],
+            id=self.color_scale_dropdown_div_id,
+        )
 
-            return color_scales
+    def register_callback(self) -> None:
+        clientside_callback(
+            ClientsideFunction(
+                namespace="clientside",
+                function_name="request_dropdown_options",
+            ),
+            Output(self.color_scale_options_request_id, "data"),
+            Input(self.color_scale_dropdown_div_id, "n_clicks"),
+            Input(self.color_scale_dropdown_id, "value"),
+            State(self.color_scale_dropdown_id, "options"),
+            prevent_initial_call=True,
+        )
 
-        return dcc.Dropdown(
-            id=self.color_scale_dropdown_id,
-            options=_get_color_scales(),
-            value=self.color_scale_dropdown_value,
+        @callback(
+            Output(self.color_scale_dropdown_id, "options"),
+            Input(self.color_scale_options_request_id, "data"),
+            prevent_initial_call=True,
         )
+        def load_color_scale_options(request: bool) -> list[dict[str, Any]]:
+            return _get_color_scales()
 
 
 # -- APP SETTINGS COMPONENTS -----------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class ThemeSwitch(ComponentWrapper):
     element_id: str = "theme-switch"
     switch_id: str = "theme-switch-switch"
@@ -1387,72 +1462,6 @@ class ThemeSwitch(ComponentWrapper):
 
     load_figure_template(light_theme_name)
 
-    clientside_callback(
-        """
-        function toggle(theme_switch, url) {
-          var themeLink = theme_switch ? url[0] : url[1];
-          var oldThemeLink = theme_switch ? url[1]: url[0];
-          var testString = "link[rel='stylesheet'][href*='" + oldThemeLink + "'],"
-            testString += "link[rel='stylesheet'][href*='" + themeLink + "'],"
-            testString += "link[rel='stylesheet'][data-href*='" + oldThemeLink + "'],"
-            testString += "link[rel='stylesheet'][data-href*='" + themeLink + "']"
-
-          var stylesheets = document.querySelectorAll(testString);
-          
-          setTimeout(function() {
-            if (stylesheets) {
-                for (let i = 0; i < stylesheets.length; i++) {
-                    if (!stylesheets[i].getAttribute('data-href')) {
-                        stylesheets[i].setAttribute('data-href', '')
-                    }
-                    if (stylesheets[i].href.includes(themeLink) || stylesheets[i].getAttribute('data-href').includes(themeLink)) {
-                        if (stylesheets[i]['data-href']) {
-                            stylesheets[i].href = stylesheets[i]['data-href'];
-                        } else {
-                            stylesheets[i].href = themeLink;
-                        }
-                        stylesheets[i].setAttribute('data-href', '')
-                    }
-                    else if (stylesheets[i].href.includes(oldThemeLink) || stylesheets[i].getAttribute('data-href').includes(oldThemeLink)) {
-                        setTimeout(function () {
-                        if (stylesheets[i]['href']) {
-                            stylesheets[i].setAttribute('data-href', stylesheets[i]['href']);
-                        } else {
-                            stylesheets[i].setAttribute('data-href', oldThemeLink)
-                        }
-                        stylesheets[i]['href'] = ''
-                        }, 100)
-                    }
-                };
-            }
-            var stylesheet = document.querySelectorAll('link[rel="stylesheet"][href*="'+ themeLink + '"]')
-            if (stylesheet.length == 0) {
-                var newLink = document.createElement('link');
-                newLink.rel = 'stylesheet';
-                newLink.href = themeLink;
-                newLink.setAttribute('data-href', '');
-                document.head.appendChild(newLink);
-            }
-          }, 100); 
-          
-          /* reload custom.css after theme has been switched to enable custom changes to theme vars */
-          setTimeout(function() {  
-              var reloadCustom = document.createElement('link');
-              reloadCustom.rel = 'stylesheet';
-              reloadCustom.href = "/assets/custom.css";
-              reloadCustom.setAttribute('data-href', '');
-              document.head.appendChild(reloadCustom);
-            }, 150);
-          
-          var themeName = themeLink.split('/').pop().replace('.css', '').toLowerCase();
-          return themeName;
-        }
-        """,
-        Output(theme_name, "children"),
-        Input(switch_id, "value"),
-        Input(store_id, "data"),
-    )
-
     def gen_component(self) -> html.Div:
         return html.Div(
             children=[
@@ -1471,184 +1480,199 @@ class ThemeSwitch(ComponentWrapper):
             id=self.element_id,
         )
 
+    def register_callback(self) -> None:
+        clientside_callback(
+            ClientsideFunction(
+                namespace="clientside", function_name="toggle_theme"
+            ),
+            Output(self.theme_name, "children"),
+            Input(self.switch_id, "value"),
+            Input(self.store_id, "data"),
+            prevent_initial_call=True,
+        )
+
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class AboutButton(Button):
     element_id: str = "about-button"
     text: str = "About"
 
 
-# TODO: Update version display.
-@dataclass(frozen=True)
-class AboutModal(ComponentWrapper):
-    element_id: str = "about-modal"
-    version = 0.1  # TODO: get version
-
-    def gen_component(self, *args, **kwargs) -> dbc.Modal:
-        about_modal_content = html.Div(
-            [
-                html.H6(
-                    f"Lipid Projector version:{self.version} (build: {""})"
-                ),
-                html.Hr(),
-                html.H4(html.B("Developers")),
-                html.P(
-                    html.Table(
-                        [
-                            html.Tr(
-                                [
-                                    html.Td(html.B("Lukas Müller")),
-                                    html.Td(
-                                        html.B(
-                                            html.A(
-                                                "FZ Borstel",
-                                                href="https://www.fz-borstel.de/index.php/de/"
-                                                "sitemap/programmbereich-infektionen/"
-                                                "bioanalytische-chemie-dr-dominik-schwudke/"
-                                                "mitarbeiter-innen#innercontent",
-                                            )
-                                        ),
-                                    ),
-                                ]
-                            ),
-                            html.Tr(
-                                [
-                                    html.Td(html.B("Timur Olzhabeav")),
-                                    html.Td(
-                                        html.B(
-                                            html.A(
-                                                "ZBH Hamburg",
-                                                href="https://www.zbh.uni-hamburg.de/en/personen/"
-                                                "bm/tolzhabaev.html",
-                                            )
-                                        ),
-                                    ),
-                                ]
-                            ),
-                        ],
-                        className="table-about",
-                    )
-                ),
-                html.H5("Editorial & Thanks to"),
-                html.P(
-                    html.Table(
-                        [
-                            html.Tr(
-                                [
-                                    html.Td("PD Dr.Dominik Schwudke"),
-                                    html.Td(
+@functools.cache
+def _get_about_modal_content(version: float) -> html.Div:
+    # Static content shared by all about modals, must not be mutated.
+    about_modal_content: html.Div = html.Div(
+        [
+            html.H6(f"Lipid Projector version:{version} (build: {""})"),
+            html.Hr(),
+            html.H4(html.B("Developers")),
+            html.P(
+                html.Table(
+                    [
+                        html.Tr(
+                            [
+                                html.Td(html.B("Lukas Müller")),
+                                html.Td(
+                                    html.B(
                                         html.A(
                                             "FZ Borstel",
                                             href="https://www.fz-borstel.de/index.php/de/"
                                             "sitemap/programmbereich-infektionen/"
                                             "bioanalytische-chemie-dr-dominik-schwudke/"
-                                            "mission",
-                                        ),
+                                            "mitarbeiter-innen#innercontent",
+                                        )
                                     ),
-                                ]
-                            ),
-                            html.Tr(
-                                [
-                                    html.Td("Prof. Dr. Andrew Torda"),
-                                    html.Td(
+                                ),
+                            ]
+                        ),
+                        html.Tr(
+                            [
+                                html.Td(html.B("Timur Olzhabeav")),
+                                html.Td(
+                                    html.B(
                                         html.A(
                                             "ZBH Hamburg",
-                                            href="https://www.zbh.uni-hamburg.de/personen/bm/"
-                                            "atorda.html",
-                                        ),
+                                            href="https://www.zbh.uni-hamburg.de/en/personen/"
+                                            "bm/tolzhabaev.html",
+                                        )
                                     ),
-                                ]
-                            ),
-                            html.Tr(
-                                [
-                                    html.Td("Daniel Krause"),
-                                    html.Td(
-                                        html.A(
-                                            "FZ Borstel",
-                                            href="https://www.fz-borstel.de/index.php/de/"
-                                            "sitemap/programmbereich-infektionen/"
-                                            "bioanalytische-chemie-dr-dominik-schwudke/"
-                                            "mitarbeiter-innen#innercontent",
-                                        ),
+                                ),
+                            ]
+                        ),
+                    ],
+                    className="table-about",
+                )
+            ),
+            html.H5("Editorial & Thanks to"),
+            html.P(
+                html.Table(
+                    [
+                        html.Tr(
+                            [
+                                html.Td("PD Dr.Dominik Schwudke"),
+                                html.Td(
+                                    html.A(
+                                        "FZ Borstel",
+                                        href="https://www.fz-borstel.de/index.php/de/"
+                                        "sitemap/programmbereich-infektionen/"
+                                        "bioanalytische-chemie-dr-dominik-schwudke/"
+                                        "mission",
                                     ),
-                                ]
-                            ),
-                            html.Tr(
-                                [
-                                    html.Td(
-                                        html.A(
-                                            "LIFS tools community",
-                                            href="https://lifs-tools.org/",
-                                        )
-                                    )
-                                ]
-                            ),
-                        ],
-                        className="table-about",
-                    )
-                ),
-                html.H5("References"),
-                html.P(
-                    html.Table(
-                        [
-                            html.Tr(
-                                [
-                                    html.Td("Drosophila lipidome data"),
-                                    html.Td(
-                                        html.A(
-                                            "Carvalho et al.(2012)",
-                                            href="https://pubmed.ncbi.nlm.nih.gov/22864382/",
-                                        ),
+                                ),
+                            ]
+                        ),
+                        html.Tr(
+                            [
+                                html.Td("Prof. Dr. Andrew Torda"),
+                                html.Td(
+                                    html.A(
+                                        "ZBH Hamburg",
+                                        href="https://www.zbh.uni-hamburg.de/personen/bm/"
+                                        "atorda.html",
                                     ),
-                                ]
-                            ),
-                            html.Tr(
-                                [
-                                    html.Td("Yeast lipidome data"),
-                                    html.Td(
-                                        html.A(
-                                            "Ejsing et al.(2009)",
-                                            href="https://pubmed.ncbi.nlm.nih.gov/19174513/",
-                                        ),
+                                ),
+                            ]
+                        ),
+                        html.Tr(
+                            [
+                                html.Td("Daniel Krause"),
+                                html.Td(
+                                    html.A(
+                                        "FZ Borstel",
+                                        href="https://www.fz-borstel.de/index.php/de/"
+                                        "sitemap/programmbereich-infektionen/"
+                                        "bioanalytische-chemie-dr-dominik-schwudke/"
+                                        "mitarbeiter-innen#innercontent",
                                     ),
-                                ]
-                            ),
-                            html.Tr(
-                                [
-                                    html.Td("SwissLipids knowledge base"),
-                                    html.Td(
-                                        html.A(
-                                            "Aimo et al.(2015)",
-                                            href="https://www.ncbi.nlm.nih.gov/pmc/articles/"
-                                            "PMC4547616/",
-                                        ),
+                                ),
+                            ]
+                        ),
+                        html.Tr(
+                            [
+                                html.Td(
+                                    html.A(
+                                        "LIFS tools community",
+                                        href="https://lifs-tools.org/",
+                                    )
+                                )
+                            ]
+                        ),
+                    ],
+                    className="table-about",
+                )
+            ),
+            html.H5("References"),
+            html.P(
+                html.Table(
+                    [
+                        html.Tr(
+                            [
+                                html.Td("Drosophila lipidome data"),
+                                html.Td(
+                                    html.A(
+                                        "Carvalho et al.(2012)",
+                                        href="https://pubmed.ncbi.nlm.nih.gov/22864382/",
                                     ),
-                                ]
-                            ),
-                            html.Tr(
-                                [
-                                    html.Td(
-                                        "LIPIDMAPS\u00AE StructureDatabase"
+                                ),
+                            ]
+                        ),
+                        html.Tr(
+                            [
+                                html.Td("Yeast lipidome data"),
+                                html.Td(
+                                    html.A(
+                                        "Ejsing et al.(2009)",
+                                        href="https://pubmed.ncbi.nlm.nih.gov/19174513/",
                                     ),
-                                    html.Td(
-                                        html.A(
-                                            "Sud et al.(2007)",
-                                            href="https://pubmed.ncbi.nlm.nih.gov/17098933/",
-                                        )
+                                ),
+                            ]
+                        ),
+                        html.Tr(
+                            [
+                                html.Td("SwissLipids knowledge base"),
+                                html.Td(
+                                    html.A(
+                                        "Aimo et al.(2015)",
+                                        href="https://www.ncbi.nlm.nih.gov/pmc/articles/"
+                                        "PMC4547616/",
                                     ),
-                                ]
-                            ),
-                        ],
-                        className="table-about",
-                    )
-                ),
-            ]
-        )
+                                ),
+                            ]
+                        ),
+                        html.Tr(
+                            [
+                                html.Td(
+                                    "LIPIDMAPS\u00AE StructureDatabase"
+                                ),
+                                html.Td(
+                                    html.A(
+                                        "Sud et al.(2007)",
+                                        href="https://pubmed.ncbi.nlm.nih.gov/17098933/",
+                                    )
+                                ),
+                            ]
+                        ),
+                    ],
+                    className="table-about",
+                )
+            ),
+        ]
+    )
+
+    return about_modal_content
+
+
+# TODO: Update version display.
+@dataclass(slots=True, eq=False)
+class AboutModal(ComponentWrapper):
+    element_id: str = "about-modal"
+    version = 0.1  # TODO: get version
 
+    def gen_component(self, *args, **kwargs) -> dbc.Modal:
         about_modal = dbc.Modal(
             [
                 dbc.ModalHeader(html.H4("About Lipidome Projector")),
-                dbc.ModalBody(about_modal_content),
+                dbc.ModalBody(_get_about_modal_content(self.version)),
             ],
             id=self.element_id,
             size="lg",
@@ -1657,37 +1681,11 @@ class AboutModal(ComponentWrapper):
 
         return about_modal
 
-    @staticmethod
-    def _get_last_commit_date() -> str:
-        try:
-            git_path: Path = Path(Path.cwd(), ".git")
-            ref_path: Path = Path(git_path / "refs" / "heads" / "main")
-            commit_hash: str = ref_path.read_text().strip()
-            commit_path: Path = Path(
-                git_path / "objects" / commit_hash[:2] / commit_hash[2:]
-            )
-            commit_data: bytes = commit_path.read_bytes()
-            decompressed_data: bytes = decompress(commit_data)
-            commit_lines: list[str] = decompressed_data.decode(
-                "utf-8", errors="ignore"
-            ).split("\n")
-            for line in commit_lines:
-                if line.startswith("committer "):
-                    timestamp: str = line.split(" ")[3]
-                    commit_date: datetime = datetime.fromtimestamp(
-                        int(timestamp)
-                    )
-                    formatted_date: str = commit_date.strftime("%d-%m-%Y")
-                    return formatted_date
-        except Exception as e:
-            print(e)
-            return "-"
-
 
 # -- MANUAL COMPONENTS -----------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class ManualTourComponent(ComponentWrapper):
     element_id: str = "manual-tour"
     frame_title: str = "Choose a manual tour"
@@ -1695,6 +1693,7 @@ class ManualTourComponent(ComponentWrapper):
     button_id: str = "start-tour-button"
     button_text: str = "Start Tour"
     dropdown_id: str = "choose-tour-dropdown"
+    state_store_id: str = "tour-state"
 
     def gen_component(self, tours) -> html.Div:
         start_tour_button: dcc.Loading = dcc.Loading(
@@ -1717,50 +1716,58 @@ class ManualTourComponent(ComponentWrapper):
         )
         return html.Div(
             children=dbc.Container(
-                [dbc.Row([dbc.Col(start_tour_button), dbc.Col(tour_dropdown)])]
+                [_gen_row(start_tour_button, tour_dropdown)]
             ),
             id=self.element_id,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TourStepAction:
     target_id: str
     target_prop: str
     value: Any
 
+    def get_value(self) -> Any:
+        """Get the value set by the action. Callable values are called
+        when the action runs, so that large values are only created if
+        the step is shown.
+        :returns: The value.
+        """
+        if callable(self.value):
+            return self.value()
+
+        return self.value
 
-@dataclass(frozen=True)
+
+@functools.cache
+def _get_tour_image_url(src: str) -> str:
+    # Tour images are served as static assets, which browsers can cache,
+    # instead of being embedded into the layout.
+    image_path: Path = (
+        files("lipidome_projector.assets").joinpath("manual_tour").joinpath(src)
+    )
+    if not image_path.exists():
+        raise FileNotFoundError(f"Tour image {image_path} not found")
+    suffix: str = image_path.suffix
+    if suffix not in [".png", ".jpg", ".jpeg", ".gif"]:
+        raise ValueError(
+            f"Tour image {image_path} has an invalid suffix {suffix}"
+        )
+
+    return f"/assets/manual_tour/{src}"
+
+
+@dataclass(frozen=True, slots=True)
 class TourStepImage:
     src: str
     description: str | html.Div = ""
 
     def get_component(self) -> html.Div:
-        image_path: Path = (
-            files(
-                "lipidome_projector.assets"
-            ).joinpath(
-                "manual_tour"
-            ).joinpath(
-                self.src
-            )
-        )
-        if image_path.exists():
-            suffix: str = image_path.suffix
-            if suffix not in [".png", ".jpg", ".jpeg", ".gif"]:
-                raise ValueError(
-                    f"Tour image {image_path} has an invalid suffix {suffix}"
-                )
-            image: str = b64encode(open(image_path, "rb").read()).decode(
-                "ascii"
-            )
-        else:
-            raise FileNotFoundError(f"Tour image {image_path} not found")
         return html.Div(
             [
                 html.Img(
-                    src=f"data:image/{suffix};base64,{image}",
-                    id=image_path.name,
+                    src=_get_tour_image_url(self.src), id=Path(self.src).name
                 ),
                 (
                     html.Div(
@@ -1774,7 +1781,7 @@ class TourStepImage:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TourStep:
     description: str | html.Div
     target: str
@@ -1783,28 +1790,41 @@ class TourStep:
     placement: str = "auto"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class TourComponent(ComponentWrapper):
     manual_tour_component: ManualTourComponent = field(default=None)
     tour_name: str = field(default=None)
+    step_index: int = field(default=None)
     next_: Self = field(default=None)
     description: str = field(default=None)
     target_id: str = field(default=None)
-    popover_id: str = field(init=False)
-    next_button_id: str = field(init=False)
-    close_button_id: str = field(init=False)
+    popover_id: dict[str, str | int] = field(init=False)
+    next_button_id: dict[str, str | int] = field(init=False)
+    close_button_id: dict[str, str | int] = field(init=False)
     action: TourStepAction | None = field(default=None)
     image: TourStepImage | None = field(default=None)
     placement: str = "auto"
 
+    POPOVER_TYPE: ClassVar[str] = "tour-popover"
+    NEXT_BUTTON_TYPE: ClassVar[str] = "tour-next"
+    CLOSE_BUTTON_TYPE: ClassVar[str] = "tour-close"
+
     def set_next(self, next_component: Self) -> None:
-        object.__setattr__(self, "next_", next_component)
+        self.next_ = next_component
+
+    def get_state(self) -> dict[str, Any]:
+        return {"target_id": self.target_id}
 
     def gen_component(self) -> dbc.Popover:
         popover = dbc.Popover(
             id=self.popover_id,
             body=True,
             placement=self.placement,
+            className=(
+                "popover"
+                if self.image is None
+                else "popover popover-max-width"
+            ),
             children=html.Div(
                 [
                     dbc.Row([html.Label(self.description)]),
@@ -1820,6 +1840,7 @@ class TourComponent(ComponentWrapper):
                                     "»",
                                     id=self.next_button_id,
                                     className="tour-button fwd-tour",
+                                    disabled=self.next_ is None,
                                 ),
                                 dbc.Button(
                                     "✖",
@@ -1837,164 +1858,88 @@ class TourComponent(ComponentWrapper):
         return popover
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "popover_id", f"popover_{self.element_id}")
-        object.__setattr__(
-            self, "next_button_id", f"popover_next_{self.element_id}"
+        self._set_popover_ids()
+
+    def _set_popover_ids(self) -> None:
+        # Pattern-matching IDs, so that a single callback can navigate all
+        # steps of a tour.
+        self.popover_id = self.get_pattern_id(
+            self.POPOVER_TYPE, self.tour_name, self.step_index
         )
-        object.__setattr__(
-            self, "close_button_id", f"popover_close_{self.element_id}"
+        self.next_button_id = self.get_pattern_id(
+            self.NEXT_BUTTON_TYPE, self.tour_name, self.step_index
         )
-
-    def register_callback(self) -> None:
-        @callback(
-            Output(
-                self.manual_tour_component.button_id,
-                "className",
-                allow_duplicate=True,
-            ),
-            Output(
-                self.manual_tour_component.button_id,
-                "disabled",
-                allow_duplicate=True,
-            ),
-            Output(
-                self.manual_tour_component.dropdown_id,
-                "disabled",
-                allow_duplicate=True,
-            ),
-            Output(self.next_.popover_id, "is_open", allow_duplicate=True),
-            Output(self.popover_id, "is_open", allow_duplicate=True),
-            Output(self.next_.popover_id, "className", allow_duplicate=True),
-            Input(self.next_button_id, "n_clicks"),
-            Input(self.close_button_id, "n_clicks"),
-            Input(self.manual_tour_component.button_id, "n_clicks"),
-            State(self.popover_id, "is_open"),
-            prevent_initial_call=True,
+        self.close_button_id = self.get_pattern_id(
+            self.CLOSE_BUTTON_TYPE, self.tour_name, self.step_index
         )
-        def toggle_popover(
-            next_button: int | None,
-            close_button: int | None,
-            start_tour: int | None,
-            is_open: bool,
-        ) -> tuple[
-            str | NoUpdate, bool | NoUpdate, bool | NoUpdate, bool, bool, str
-        ]:
-            next_popover_width_class = (
-                "popover"
-                if self.next_.image is None
-                else "popover popover-max-width"
-            )
-            if self.close_button_id in ctx.triggered_id:
-                return (
-                    no_update,
-                    False,
-                    False,
-                    False,
-                    False,
-                    next_popover_width_class,
-                )
-            elif self.next_button_id in ctx.triggered_id:
-                return (
-                    no_update,
-                    no_update,
-                    no_update,
-                    True,
-                    False,
-                    next_popover_width_class,
-                )
-            elif (
-                is_open
-                and self.manual_tour_component.button_id in ctx.triggered_id
-            ):
-                return (
-                    "loading",
-                    True,
-                    True,
-                    no_update,
-                    False,
-                    next_popover_width_class,
-                )
-            raise PreventUpdate
 
-        clientside_callback(
-            ClientsideFunction(
-                namespace="clientside",
-                function_name="tour_listens_to_keys",
-            ),
-            Output(self.next_button_id, "n_clicks"),
-            Input(self.popover_id, "is_open"),
-            State(self.next_button_id, "id"),
-            State(self.close_button_id, "id"),
-            prevent_initial_call=True,
-        )
+    @staticmethod
+    def get_pattern_id(
+        type_: str, tour_name: str, step_index: Any
+    ) -> dict[str, Any]:
+        return {"type": type_, "tour": tour_name, "step": step_index}
 
+    def register_callback(self) -> None:
         if self.action is not None:
+            action: TourStepAction = self.action
 
+            # Action values, such as the example upload files, are
+            # returned by the server instead of being part of the layout.
             @callback(
                 Output(
-                    self.action.target_id,
-                    self.action.target_prop,
-                    allow_duplicate=True,
+                    action.target_id, action.target_prop, allow_duplicate=True
                 ),
                 Input(self.popover_id, "is_open"),
                 prevent_initial_call=True,
             )
-            def action(is_open: bool) -> Any:
+            def tour_step_action(is_open: bool) -> Any:
                 if is_open:
-                    return self.action.value
+                    return action.get_value()
                 else:
                     raise PreventUpdate
 
-            @callback(
+            # necessary because popover lose target on a closed modal leaves the DOM:
+            # https://community.plotly.com/t/dbc-popover-loses-target-when-target-leaves-dom-and-cannot-be-retargeted/84863
+            clientside_callback(
+                ClientsideFunction(
+                    namespace="clientside",
+                    function_name="unset_tour_target",
+                ),
                 Output(self.popover_id, "target", allow_duplicate=True),
                 Input(self.next_button_id, "n_clicks"),
                 prevent_initial_call=True,
             )
-            def unset_target(
-                n_clicks: int | None,
-            ) -> bool:
-                # necessary because popover lose target on a closed modal leaves the DOM:
-                # https://community.plotly.com/t/dbc-popover-loses-target-when-target-leaves-dom-and-cannot-be-retargeted/84863
-                return False
 
     def set_target(self) -> None:
-        @callback(
+        clientside_callback(
+            ClientsideFunction(
+                namespace="clientside",
+                function_name="set_next_tour_target",
+            ),
             Output(self.next_.popover_id, "target", allow_duplicate=True),
             Input(self.popover_id, "is_open"),
+            State(self.popover_id, "id"),
+            State(self.manual_tour_component.state_store_id, "data"),
             prevent_initial_call=True,
         )
-        def set_targets(is_open: bool) -> str:
-            if is_open:
-                return self.next_.target_id
-            else:
-                raise PreventUpdate
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class TourComponentStart(TourComponent):
     element_id: str = field(default=None)
+    step_index: int = field(default=0, init=False)
     description: str = field(default=None)
     target_id: str = field(init=False)
 
     def __post_init__(self) -> None:
-        object.__setattr__(
-            self, "element_id", f"start-tour-step_{self.tour_name}"
-        )
-        object.__setattr__(
-            self, "target_id", self.manual_tour_component.button_id
-        )
-        object.__setattr__(self, "popover_id", f"popover_{self.element_id}")
-        object.__setattr__(
-            self, "next_button_id", f"popover_next_{self.element_id}"
-        )
-        object.__setattr__(
-            self, "close_button_id", f"popover_close_{self.element_id}"
-        )
-        object.__setattr__(
-            self,
-            "description",
-            f"Click '»' to start '{self.tour_name}' tour. You can also navigate through the tour using the right arrow key and close it with the escape key.",
+        self.element_id = f"start-tour-step_{self.tour_name}"
+        self.target_id = self.manual_tour_component.button_id
+        self._set_popover_ids()
+        self.description = (
+            f"Click '»' to start '{self.tour_name}' tour. You can also navigate through the tour using the right arrow key and close it with the escape key."
         )
+
+    def register_callback(self) -> None:
         clientside_callback(
             ClientsideFunction(
                 namespace="clientside", function_name="updateButtonColor"
@@ -2005,71 +1950,22 @@ class TourComponentStart(TourComponent):
             prevent_initial_call=True,
         )
 
-    def register_callback(self) -> None:
-
-        @callback(
-            Output(
-                self.manual_tour_component.button_id,
-                "disabled",
-                allow_duplicate=True,
-            ),
-            Output(
-                self.manual_tour_component.dropdown_id,
-                "disabled",
-                allow_duplicate=True,
-            ),
-            Output(self.next_.popover_id, "is_open", allow_duplicate=True),
-            Output(self.popover_id, "is_open", allow_duplicate=True),
-            Input(self.manual_tour_component.button_id, "n_clicks"),
-            Input(self.next_button_id, "n_clicks"),
-            Input(self.close_button_id, "n_clicks"),
-            State(self.manual_tour_component.dropdown_id, "value"),
-            prevent_initial_call=True,
-        )
-        def toggle_popover(
-            start_tour: int | None,
-            next_button: int | None,
-            close_button: int | None,
-            chosen_tour: str,
-        ) -> tuple[bool | NoUpdate, bool | NoUpdate, bool, bool]:
-            if chosen_tour == self.tour_name:
-                if self.close_button_id in ctx.triggered_id:
-                    return False, False, False, False
-                elif self.manual_tour_component.button_id in ctx.triggered_id:
-                    return True, True, False, True
-                elif self.next_button_id in ctx.triggered_id:
-                    return no_update, no_update, True, False
-            else:
-                raise PreventUpdate
-
+    def set_target(self):
         clientside_callback(
             ClientsideFunction(
                 namespace="clientside",
-                function_name="tour_listens_to_keys",
+                function_name="set_start_tour_targets",
             ),
-            Output(self.next_button_id, "n_clicks"),
-            Input(self.popover_id, "is_open"),
-            State(self.next_button_id, "id"),
-            State(self.close_button_id, "id"),
-            prevent_initial_call=True,
-        )
-
-    def set_target(self):
-        @callback(
             Output(self.popover_id, "target"),
             Output(self.next_.popover_id, "target"),
             Input(self.manual_tour_component.button_id, "n_clicks"),
-            State(self.popover_id, "target"),
+            State(self.popover_id, "id"),
+            State(self.manual_tour_component.state_store_id, "data"),
             prevent_initial_call=True,
         )
-        def set_target(start_tour: int | None, target: str) -> tuple[str, str]:
-            return (
-                self.manual_tour_component.button_id,
-                self.next_.target_id,
-            )
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class TourComponentEnd(TourComponent):
     settings_accordion: SettingsAccordion = field(default=None)
     element_id: str = field(default=None)
@@ -2077,77 +1973,43 @@ class TourComponentEnd(TourComponent):
     target_id: str = field(init=False)
 
     def __post_init__(self) -> None:
-        object.__setattr__(
-            self, "element_id", f"end-tour-step_{self.tour_name}"
-        )
-        object.__setattr__(
-            self, "target_id", self.settings_accordion.manual_id
-        )
-        object.__setattr__(self, "popover_id", f"popover_{self.element_id}")
-        object.__setattr__(
-            self, "next_button_id", f"popover_next_{self.element_id}"
-        )
-        object.__setattr__(
-            self, "close_button_id", f"popover_close_{self.element_id}"
-        )
-        object.__setattr__(
-            self, "description", f"Click '✖' to end '{self.tour_name}' tour."
-        )
-
-    def register_callback(self) -> None:
-        @callback(
-            Output(self.next_button_id, "disabled"),
-            Input(self.next_button_id, "id"),
-        )
-        def disable_next_button(id_: str) -> bool:
-            return True
-
-        @callback(
-            Output(
-                self.manual_tour_component.button_id,
-                "disabled",
-                allow_duplicate=True,
-            ),
-            Output(
-                self.manual_tour_component.dropdown_id,
-                "disabled",
-                allow_duplicate=True,
-            ),
-            Output(self.popover_id, "is_open", allow_duplicate=True),
-            Input(self.close_button_id, "n_clicks"),
-            prevent_initial_call=True,
-        )
-        def toggle_popover(
-            close_button: int | None,
-        ) -> tuple[bool, bool, bool]:
-            return False, False, False
-
-        clientside_callback(
-            ClientsideFunction(
-                namespace="clientside",
-                function_name="tour_listens_to_keys",
-            ),
-            Output(self.next_button_id, "n_clicks"),
-            Input(self.popover_id, "is_open"),
-            State(self.next_button_id, "id"),
-            State(self.close_button_id, "id"),
-            prevent_initial_call=True,
-        )
+        self.element_id = f"end-tour-step_{self.tour_name}"
+        self.target_id = self.settings_accordion.manual_id
+        self._set_popover_ids()
+        self.description = f"Click '✖' to end '{self.tour_name}' tour."
 
     def set_target(self) -> None:
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TourHandler:
     manual_tour_component: ManualTourComponent
     settings_accordion: SettingsAccordion
 
+    _tour_components: dict[tuple[str, ...], list[Component]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def gen_tour_components(
-        self, tours: dict[str, list[TourStep]]
+        self, tours: dict[str, tuple[TourStep, ...]]
+    ) -> list[Component]:
+        # The callbacks of a tour can only be registered once, so repeated
+        # calls reuse the components generated by the first one.
+        tour_names: tuple[str, ...] = tuple(tours)
+        if tour_names not in self._tour_components:
+            self._tour_components[tour_names] = self._gen_tour_components(
+                tours
+            )
+
+        return self._tour_components[tour_names]
+
+    def _gen_tour_components(
+        self, tours: dict[str, tuple[TourStep, ...]]
     ) -> list[Component]:
 
-        tours_steps: list[Component] = []
+        tours_steps: dict[str, list[TourComponent]] = {}
+        tour_components: list[Component] = []
 
         for tour_name, tour_list in tours.items():
 
@@ -2158,17 +2020,22 @@ class TourHandler:
                     self._get_tour_step(tour_name, step, step_index)
                 )
 
-            tour_steps.append(self._get_tour_end(tour_name))
+            tour_steps.append(self._get_tour_end(tour_name, len(tour_steps)))
 
             self._set_next(tour_steps)
 
-            self._register_callbacks(tour_steps)
+            # Once the steps are linked, each one is registered and
+            # generated in a single pass.
+            self._register_tour_callbacks(tour_name)
 
-            self._set_target(tour_steps)
+            for tour_step in tour_steps:
+                tour_step.register_callback()
+                tour_step.set_target()
+                tour_components.append(tour_step.get_component())
 
-            tours_steps.extend(self._get_components(tour_steps))
+            tours_steps[tour_name] = tour_steps
 
-        return tours_steps
+        return [*tour_components, self._get_tour_state_store(tours_steps)]
 
     def _get_tour_step(
         self, tour_name: str, step: TourStep, step_index: int
@@ -2177,6 +2044,7 @@ class TourHandler:
         return TourComponent(
             element_id=f"target:{step.target}_tour-step:{step_index}_tour:{tour_name}",
             tour_name=tour_name,
+            step_index=step_index + 1,
             target_id=step.target,
             description=step.description,
             manual_tour_component=self.manual_tour_component,
@@ -2191,37 +2059,120 @@ class TourHandler:
             tour_name=tour_name,
         )
 
-    def _get_tour_end(self, tour_name: str) -> TourComponent:
+    def _get_tour_end(self, tour_name: str, step_index: int) -> TourComponent:
         return TourComponentEnd(
             settings_accordion=self.settings_accordion,
             tour_name=tour_name,
+            step_index=step_index,
             manual_tour_component=self.manual_tour_component,
         )
 
-    @staticmethod
-    def _get_components(tour_steps: list[TourComponent]) -> list[Component]:
-        return [tour_step.get_component() for tour_step in tour_steps]
-
-    @staticmethod
-    def _set_next(tour_steps: list[TourComponent]) -> None:
-        tour_steps[0].set_next(tour_steps[1])
+    def _get_tour_state_store(
+        self, tours_steps: dict[str, list[TourComponent]]
+    ) -> dcc.Store:
+        # The navigation state of the tours is evaluated clientside.
+        return dcc.Store(
+            id=self.manual_tour_component.state_store_id,
+            data={
+                "start_button_id": self.manual_tour_component.button_id,
+                "tours": {
+                    tour_name: [
+                        tour_step.get_state() for tour_step in tour_steps
+                    ]
+                    for tour_name, tour_steps in tours_steps.items()
+                },
+            },
+        )
 
-        for i in range(1, len(tour_steps)):
-            if i < len(tour_steps) - 1 and tour_steps[i + 1] is not None:
-                tour_steps[i].set_next(tour_steps[i + 1])
+    def _register_tour_callbacks(self, tour_name: str) -> None:
+        clientside_callback(
+            ClientsideFunction(
+                namespace="clientside",
+                function_name="navigate_tour",
+            ),
+            Output(
+                self.manual_tour_component.button_id,
+                "className",
+                allow_duplicate=True,
+            ),
+            Output(
+                self.manual_tour_component.button_id,
+                "disabled",
+                allow_duplicate=True,
+            ),
+            Output(
+                self.manual_tour_component.dropdown_id,
+                "disabled",
+                allow_duplicate=True,
+            ),
+            Output(
+                TourComponent.get_pattern_id(
+                    TourComponent.POPOVER_TYPE, tour_name, ALL
+                ),
+                "is_open",
+            ),
+            Input(self.manual_tour_component.button_id, "n_clicks"),
+            Input(
+                TourComponent.get_pattern_id(
+                    TourComponent.NEXT_BUTTON_TYPE, tour_name, ALL
+                ),
+                "n_clicks",
+            ),
+            Input(
+                TourComponent.get_pattern_id(
+                    TourComponent.CLOSE_BUTTON_TYPE, tour_name, ALL
+                ),
+                "n_clicks",
+            ),
+            State(self.manual_tour_component.dropdown_id, "value"),
+            State(
+                TourComponent.get_pattern_id(
+                    TourComponent.POPOVER_TYPE, tour_name, ALL
+                ),
+                "is_open",
+            ),
+            prevent_initial_call=True,
+        )
 
-    @staticmethod
-    def _register_callbacks(tour_steps: list[TourComponent]) -> None:
-        for tour_step in tour_steps:
-            tour_step.register_callback()
+        clientside_callback(
+            ClientsideFunction(
+                namespace="clientside",
+                function_name="tour_listens_to_keys",
+            ),
+            Output(
+                TourComponent.get_pattern_id(
+                    TourComponent.NEXT_BUTTON_TYPE, tour_name, ALL
+                ),
+                "n_clicks",
+            ),
+            Input(
+                TourComponent.get_pattern_id(
+                    TourComponent.POPOVER_TYPE, tour_name, ALL
+                ),
+                "is_open",
+            ),
+            State(
+                TourComponent.get_pattern_id(
+                    TourComponent.NEXT_BUTTON_TYPE, tour_name, ALL
+                ),
+                "id",
+            ),
+            State(
+                TourComponent.get_pattern_id(
+                    TourComponent.CLOSE_BUTTON_TYPE, tour_name, ALL
+                ),
+                "id",
+            ),
+            prevent_initial_call=True,
+        )
 
     @staticmethod
-    def _set_target(tour_steps: list[TourComponent]) -> None:
-        for tour_step in tour_steps:
-            tour_step.set_target()
+    def _set_next(tour_steps: list[TourComponent]) -> None:
+        for tour_step, next_tour_step in pairwise(tour_steps):
+            tour_step.set_next(next_tour_step)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class SessionDownloadComponent(ComponentWrapper):
     element_id: str = "session-download-component"
     button_id: str = "session-download-button"
@@ -2232,17 +2183,6 @@ class SessionDownloadComponent(ComponentWrapper):
             "Download Session State", id=self.button_id
         )
 
-        upload_style: dict[str, str] = {
-            "width": "50%",
-            "height": "40px",
-            "lineHeight": "20px",
-            "borderWidth": "1px",
-            "borderStyle": "dashed",
-            "borderRadius": "5px",
-            "textAlign": "center",
-            "margin": "10px",
-        }
-
         return html.Div(
             [
                 download_button,
@@ -2250,7 +2190,7 @@ class SessionDownloadComponent(ComponentWrapper):
                 dcc.Upload(
                     id=self.upload_id,
                     children=["Upload Session State"],
-                    style=upload_style,
+                    style=_UPLOAD_STYLE,
                 ),
                 dcc.Download(id=self.element_id),
             ],
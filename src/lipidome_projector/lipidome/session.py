@@ -1,16 +1,33 @@
 """ """
 
+import base64
+import hashlib
 import logging
 import json
+import threading
 
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from typing import Self
 
+import orjson
+import zstandard
+
 from lipidome_projector.graph.scatter_cfg import ScatterCfg
-from lipidome_projector.lipidome.grid_data import GridDataCollection
+from lipidome_projector.lipidome.grid_data import (
+    GridData,
+    GridDataCollection,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_SESSION_CACHE_MAXSIZE: int = 8
+_ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL: int = 10
+
+_session_cache: OrderedDict[bytes, "SessionState"] = OrderedDict()
+_session_cache_lock: threading.Lock = threading.Lock()
+
 
 @dataclass(frozen=True)
 class SessionState:
@@ -44,5 +61,90 @@ class SessionState:
         content_dict: dict = json.loads(json_str)
         return cls.from_dict(content_dict)
 
+    @classmethod
+    def from_json_bytes(cls, json_bytes: bytes) -> Self:
+        content_dict: dict = orjson.loads(json_bytes)
+        return cls.from_dict(content_dict)
+
+    @classmethod
+    def from_upload_contents(cls, contents: str) -> Self:
+        """Create a session state from the contents of an upload
+        component. Both plain and zstd compressed session files are
+        accepted. Parsed session states are cached by a digest of the
+        contents, so that repeated uploads of the same file are not
+        decoded and parsed again.
+        :param contents: Base64 encoded data URL of the session file.
+        :returns: The session state.
+        """
+        header_end: int = contents.index(",") + 1
+        payload: bytes = contents[header_end:].encode("ascii")
+        digest: bytes = hashlib.blake2b(payload, digest_size=16).digest()
+
+        with _session_cache_lock:
+            session: Self | None = _session_cache.get(digest)
+            if session is not None:
+                _session_cache.move_to_end(digest)
+                return session
+
+        session_bytes: bytes = base64.b64decode(payload)
+        if session_bytes.startswith(_ZSTD_MAGIC):
+            session_bytes = zstandard.ZstdDecompressor().decompress(
+                session_bytes
+            )
+
+        session = cls.from_json_bytes(session_bytes)
+
+        with _session_cache_lock:
+            _session_cache[digest] = session
+            if len(_session_cache) > _SESSION_CACHE_MAXSIZE:
+                _session_cache.popitem(last=False)
+
+        return session
+
+    def to_upload_callback_tuple(self) -> tuple:
+        """Get the settings and grid data of the session in the order of
+        the outputs of the session upload callback.
+        :returns: Tuple of callback outputs.
+        """
+        scatter_cfg: ScatterCfg = self.scatter_cfg
+        gdc: GridDataCollection = self.gdc
+        lipidome_data: GridData = gdc.lipidome_data
+        lipid_data: GridData = gdc.lipid_data
+        difference_data: GridData = gdc.difference_data
+        log2fc_data: GridData = gdc.log2fc_data
+
+        return (
+            scatter_cfg.mode,
+            scatter_cfg.dim,
+            scatter_cfg.sizemode,
+            scatter_cfg.scaling_method,
+            scatter_cfg.min_max_scaling_value,
+            scatter_cfg.linear_scaling_factor,
+            scatter_cfg.linear_scaling_base,
+            lipidome_data.records,
+            lipidome_data.virtual_records,
+            lipidome_data.col_groups_defs,
+            self.lipidome_filter_model,
+            lipid_data.records,
+            lipid_data.virtual_records,
+            lipid_data.col_groups_defs,
+            self.lipid_filter_model,
+            difference_data.records,
+            difference_data.virtual_records,
+            difference_data.col_groups_defs,
+            difference_data.selected_rows,
+            self.difference_filter_model,
+            log2fc_data.records,
+            log2fc_data.virtual_records,
+            log2fc_data.col_groups_defs,
+            log2fc_data.selected_rows,
+            self.log2fc_filter_model,
+        )
+
     def to_json(self) -> str:
         return json.dumps(asdict(self))
+
+    def to_compressed_json(self) -> bytes:
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(
+            self.to_json().encode()
+        )
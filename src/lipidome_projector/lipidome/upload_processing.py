@@ -4,6 +4,7 @@ import base64
 import io
 import logging
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from lipid_data_processing.lipidomes.lipidome_dataset import LipidomeDataset
@@ -34,12 +35,19 @@ logger: logging.Logger = logging.getLogger(__name__)
 # TODO: Simplify and utilize / introduce abstractions.
 
 
+def _ignore_progress(message: str) -> None:
+    pass
+
+
 @dataclass(frozen=True)
-class LipidomeUploadOutput:
+class LipidomeUploadResults:
     lipidome_fe_data: LipidomeFrontEndData
     failures_records: list[dict]
     failures_column_defs: list[dict]
-    processing_failure: bool
+
+
+@dataclass(frozen=True)
+class LipidomeUploadFailure:
     failure_message: str
 
 
@@ -51,7 +59,8 @@ def process_lipidome_upload(
     lcb_constraints_contents: str,
     database: BaseDB,
     col_names: ColNames,
-) -> LipidomeUploadOutput:
+    report_progress: Callable[[str], None] = _ignore_progress,
+) -> LipidomeUploadResults | LipidomeUploadFailure:
     """Process the lipidome upload.
     :param name: Name of the lipidome.
     :param abundances_contents: Contents of the abundances file.
@@ -62,10 +71,11 @@ def process_lipidome_upload(
         file.
     :param database: Database to use for matching.
     :param col_names: Column names.
-    :return: Lipidome upload output.
+    :param report_progress: Function receiving progress messages.
+    :return: Lipidome upload results or failure.
     """
     try:
-        lipidome_output: LipidomeUploadOutput = (
+        lipidome_output: LipidomeUploadResults | LipidomeUploadFailure = (
             _attempt_process_lipidome_upload(
                 name=name,
                 abundances_contents=abundances_contents,
@@ -74,16 +84,11 @@ def process_lipidome_upload(
                 lcb_constraints_contents=lcb_constraints_contents,
                 database=database,
                 col_names=col_names,
+                report_progress=report_progress,
             )
         )
     except Exception as e:
-        lipidome_output = LipidomeUploadOutput(
-            lipidome_fe_data=LipidomeFrontEndData(),
-            failures_records=list(),
-            failures_column_defs=list(),
-            processing_failure=True,
-            failure_message=str(e),
-        )
+        lipidome_output = LipidomeUploadFailure(failure_message=str(e))
 
     return lipidome_output
 
@@ -96,7 +101,8 @@ def _attempt_process_lipidome_upload(
     lcb_constraints_contents: str,
     database: BaseDB,
     col_names: ColNames,
-) -> LipidomeUploadOutput:
+    report_progress: Callable[[str], None],
+) -> LipidomeUploadResults:
     lipidome_ds: LipidomeDataset
     matching_summary: MatchingSummary
     lipidome_ds, matching_summary = _gen_and_match_ds(
@@ -107,8 +113,11 @@ def _attempt_process_lipidome_upload(
         lcb_constraints_contents=lcb_constraints_contents,
         database=database,
         lipid_col_name=col_names.lipid,
+        report_progress=report_progress,
     )
 
+    report_progress("Preparing lipidome data...")
+
     failures_records: list[dict]
     failures_column_defs: list[dict]
     failures_records, failures_column_defs = _get_failrues_grid_data(
@@ -121,12 +130,10 @@ def _attempt_process_lipidome_upload(
         lipidome_ds, col_names
     )
 
-    return LipidomeUploadOutput(
+    return LipidomeUploadResults(
         lipidome_fe_data=lipidome_fe_data,
         failures_records=failures_records,
         failures_column_defs=failures_column_defs,
-        processing_failure=False,
-        failure_message="",
     )
 
 
@@ -138,7 +145,10 @@ def _gen_and_match_ds(
     lcb_constraints_contents: str,
     database: BaseDB,
     lipid_col_name: str,
+    report_progress: Callable[[str], None],
 ) -> tuple[LipidomeDataset, MatchingSummary]:
+    report_progress("Parsing uploaded files...")
+
     datasets: tuple[LipidomeDataset, ConstraintsDataset] = (
         _generate_base_datasets(
             name=name,
@@ -149,6 +159,8 @@ def _gen_and_match_ds(
         )
     )
 
+    report_progress("Matching lipids...")
+
     lipidome_ds: LipidomeDataset
     matching_summary: MatchingSummary
     lipidome_ds, matching_summary = match(*datasets, database, lipid_col_name)
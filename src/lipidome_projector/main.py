@@ -1,11 +1,15 @@
 """Lipidome projector entry point."""
 
 import logging
+import tempfile
 
 from importlib.resources import files
 from pathlib import Path
 
-from dash import Dash
+import diskcache
+import plotly.io as pio
+
+from dash import Dash, DiskcacheManager
 from dash.html import Div
 
 from lipidome_projector.callbacks.callback_registration import (
@@ -27,18 +31,32 @@ def _setup_logging() -> None:
     logging.basicConfig(level=logging.DEBUG)
 
 
+def _setup_json_serialization() -> None:
+    # Dash serializes callback responses and the layout through plotly's
+    # JSON encoder, whose orjson engine is considerably faster for large
+    # grid record payloads.
+    pio.json.config.default_engine = "orjson"
+
+
 def _load_db(path: Path) -> BaseDB:
     database: BaseDB = create_database(path)
 
     return database
 
 
-def _create_app(layout: Div) -> Dash:
+def _create_background_callback_manager(cache_dir: Path) -> DiskcacheManager:
+    return DiskcacheManager(diskcache.Cache(cache_dir))
+
+
+def _create_app(
+    layout: Div, background_callback_manager: DiskcacheManager
+) -> Dash:
     app: Dash = Dash(
         __name__,
         assets_ignore="SLATE.css",
         prevent_initial_callbacks=True,
         title="Lipidome Projector",
+        background_callback_manager=background_callback_manager,
     )
 
     app.layout = layout
@@ -51,6 +69,8 @@ def main() -> None:
 
     _setup_logging()
 
+    _setup_json_serialization()
+
     logger.info("Initialize.")
 
     database: BaseDB = _load_db(
@@ -86,16 +106,24 @@ def main() -> None:
         default_lipidome_data._dataset_descriptions, col_names
     )
 
-    app: Dash = _create_app(layout)
-
     # debug: bool = True
     debug: bool = False
     # use_reloader: bool = True
     use_reloader: bool = False
 
-    app.run_server(
-        debug=debug, host="0.0.0.0", port=8050, use_reloader=use_reloader
-    )
+    # Each app uses its own background callback cache, which is removed
+    # when the server stops.
+    with tempfile.TemporaryDirectory(
+        prefix="lipidome_projector_background_"
+    ) as background_cache_dir:
+        app: Dash = _create_app(
+            layout,
+            _create_background_callback_manager(Path(background_cache_dir)),
+        )
+
+        app.run_server(
+            debug=debug, host="0.0.0.0", port=8050, use_reloader=use_reloader
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+import os
+
+from pathlib import Path
+
+import pytest
+
+from lipidome_projector.database.db_handling import (
+    _load_db_config_cached,
+    _load_db_config_dict,
+)
+
+
+def _write_config(path: Path, name: str, mtime_ns: int) -> Path:
+    path.write_text(f'type = "in_memory_db_df"\nname = "{name}"\n')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    return path
+
+
+def test_load_db_config_dict_is_cached(tmp_path: Path) -> None:
+    _load_db_config_cached.cache_clear()
+    config_path: Path = _write_config(tmp_path / "db.toml", "a", 10**18)
+
+    config_dict: dict = _load_db_config_dict(config_path)
+    config_dict["name"] = "changed"
+
+    assert _load_db_config_dict(config_path)["name"] == "a"
+    assert _load_db_config_cached.cache_info().hits == 1
+
+
+def test_load_db_config_dict_reloads_modified_file(tmp_path: Path) -> None:
+    _load_db_config_cached.cache_clear()
+    config_path: Path = _write_config(tmp_path / "db.toml", "a", 10**18)
+
+    assert _load_db_config_dict(config_path)["name"] == "a"
+
+    _write_config(config_path, "b", 10**18 + 1)
+
+    assert _load_db_config_dict(config_path)["name"] == "b"
+    assert _load_db_config_cached.cache_info().hits == 0
+
+
+def test_load_db_config_dict_unknown_type(tmp_path: Path) -> None:
+    config_path: Path = tmp_path / "db.toml"
+    config_path.write_text('type = "unknown"\n')
+
+    with pytest.raises(ValueError):
+        _load_db_config_dict(config_path)
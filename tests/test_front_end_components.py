@@ -0,0 +1,222 @@
+from collections.abc import Callable
+from typing import Any
+
+import dash._callback
+import pytest
+
+from dash import ALL, Input, Output, dcc
+from dash.exceptions import PreventUpdate
+
+import lipidome_projector.front_end.front_end_components as fec
+
+
+@pytest.fixture
+def registered_callbacks(monkeypatch: pytest.MonkeyPatch) -> list[Callable]:
+    # Server callbacks are collected instead of being registered with Dash.
+    callbacks: list[Callable] = []
+
+    def callback(*args, **kwargs) -> Callable[[Callable], Callable]:
+        def decorator(func: Callable) -> Callable:
+            callbacks.append(func)
+            return func
+
+        return decorator
+
+    monkeypatch.setattr(fec, "callback", callback)
+    monkeypatch.setattr(fec, "clientside_callback", lambda *args, **kw: None)
+
+    return callbacks
+
+
+def test_tour_step_action_value() -> None:
+    calls: list[None] = []
+
+    def get_value() -> str:
+        calls.append(None)
+        return "data:text/csv;base64,"
+
+    action: fec.TourStepAction = fec.TourStepAction(
+        target_id="upload", target_prop="contents", value=get_value
+    )
+
+    assert calls == []
+    assert action.get_value() == "data:text/csv;base64,"
+    assert fec.TourStepAction("switch", "value", True).get_value() is True
+
+
+def test_tour_step_action_callback(
+    registered_callbacks: list[Callable],
+) -> None:
+    values: list[Any] = ["data:text/csv;base64,"]
+    tour_component: fec.TourComponent = fec.TourComponent(
+        element_id="tour-step",
+        tour_name="Load data",
+        step_index=1,
+        action=fec.TourStepAction(
+            target_id="upload", target_prop="contents", value=values.pop
+        ),
+    )
+
+    tour_component.register_callback()
+    (tour_step_action,) = registered_callbacks
+
+    with pytest.raises(PreventUpdate):
+        tour_step_action(False)
+
+    assert values == ["data:text/csv;base64,"]
+    assert tour_step_action(True) == "data:text/csv;base64,"
+
+
+_TOUR_STEPS: tuple[fec.TourStep, ...] = (
+    fec.TourStep(description="First step.", target="upload"),
+    fec.TourStep(
+        description="Second step.",
+        target="graph",
+        action=fec.TourStepAction(
+            target_id="upload", target_prop="contents", value="data:,"
+        ),
+    ),
+)
+
+
+@pytest.fixture
+def tour_components(monkeypatch: pytest.MonkeyPatch) -> list:
+    # The callbacks are registered with empty global callback lists, which
+    # are restored afterwards.
+    monkeypatch.setattr(dash._callback, "GLOBAL_CALLBACK_LIST", [])
+    monkeypatch.setattr(dash._callback, "GLOBAL_CALLBACK_MAP", {})
+
+    tour_handler: fec.TourHandler = fec.TourHandler(
+        fec.ManualTourComponent(), fec.SettingsAccordion()
+    )
+
+    return tour_handler.gen_tour_components(
+        {"Load data": _TOUR_STEPS, "Graph": _TOUR_STEPS[:1]}
+    )
+
+
+def _get_clientside_callbacks(function_name: str) -> list[dict]:
+    return [
+        callback_dict
+        for callback_dict in dash._callback.GLOBAL_CALLBACK_LIST
+        if (callback_dict.get("clientside_function") or {}).get(
+            "function_name"
+        )
+        == function_name
+    ]
+
+
+def _get_tour_pattern_id(type_: str, tour_name: str) -> dict[str, Any]:
+    return fec.TourComponent.get_pattern_id(type_, tour_name, ALL)
+
+
+def test_tour_pattern_ids() -> None:
+    tour_component: fec.TourComponent = fec.TourComponent(
+        element_id="tour-step", tour_name="Load data", step_index=2
+    )
+
+    assert tour_component.popover_id == {
+        "type": fec.TourComponent.POPOVER_TYPE,
+        "tour": "Load data",
+        "step": 2,
+    }
+    assert tour_component.next_button_id["type"] == (
+        fec.TourComponent.NEXT_BUTTON_TYPE
+    )
+    assert tour_component.close_button_id["step"] == 2
+
+
+@pytest.mark.parametrize("tour_name", ["Load data", "Graph"])
+def test_tour_navigation_callback(
+    tour_components: list, tour_name: str
+) -> None:
+    popover_output: str = str(
+        Output(
+            _get_tour_pattern_id(fec.TourComponent.POPOVER_TYPE, tour_name),
+            "is_open",
+        )
+    )
+    (navigate_callback,) = [
+        callback_dict
+        for callback_dict in _get_clientside_callbacks("navigate_tour")
+        if popover_output in callback_dict["output"]
+    ]
+
+    for type_ in [
+        fec.TourComponent.NEXT_BUTTON_TYPE,
+        fec.TourComponent.CLOSE_BUTTON_TYPE,
+    ]:
+        button_input: dict = Input(
+            _get_tour_pattern_id(type_, tour_name), "n_clicks"
+        ).to_dict()
+        assert button_input in navigate_callback["inputs"]
+
+    assert len(_get_clientside_callbacks("navigate_tour")) == 2
+
+
+def test_tour_key_listener_callbacks(tour_components: list) -> None:
+    key_callbacks: list[dict] = _get_clientside_callbacks(
+        "tour_listens_to_keys"
+    )
+
+    assert [callback_dict["output"] for callback_dict in key_callbacks] == [
+        str(
+            Output(
+                _get_tour_pattern_id(
+                    fec.TourComponent.NEXT_BUTTON_TYPE, tour_name
+                ),
+                "n_clicks",
+            )
+        )
+        for tour_name in ["Load data", "Graph"]
+    ]
+    assert [callback_dict["inputs"] for callback_dict in key_callbacks] == [
+        [
+            Input(
+                _get_tour_pattern_id(
+                    fec.TourComponent.POPOVER_TYPE, tour_name
+                ),
+                "is_open",
+            ).to_dict()
+        ]
+        for tour_name in ["Load data", "Graph"]
+    ]
+
+
+def test_tour_state_store(tour_components: list) -> None:
+    tour_state_store: dcc.Store = tour_components[-1]
+
+    assert tour_state_store.data == {
+        "start_button_id": fec.ManualTourComponent().button_id,
+        "tours": {
+            "Load data": [
+                {"target_id": fec.ManualTourComponent().button_id},
+                {"target_id": "upload"},
+                {"target_id": "graph"},
+                {"target_id": fec.SettingsAccordion().manual_id},
+            ],
+            "Graph": [
+                {"target_id": fec.ManualTourComponent().button_id},
+                {"target_id": "upload"},
+                {"target_id": fec.SettingsAccordion().manual_id},
+            ],
+        },
+    }
+
+
+def test_tour_action_server_callback(tour_components: list) -> None:
+    (action_callback,) = [
+        callback_dict
+        for callback_dict in dash._callback.GLOBAL_CALLBACK_LIST
+        if callback_dict["output"].startswith("upload.contents")
+    ]
+
+    assert action_callback.get("clientside_function") is None
+    assert action_callback["inputs"] == [
+        Input(
+            fec.TourComponent.get_pattern_id(
+                fec.TourComponent.POPOVER_TYPE, "Load data", 2
+            ),
+            "is_open",
+        ).to_dict()
+    ]
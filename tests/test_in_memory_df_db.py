@@ -0,0 +1,368 @@
+import os
+import zipfile
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyarrow import feather
+
+from lipidome_projector.database.in_memory_df_db import (
+    _STR_DTYPE,
+    InMemoryDataFrameDB,
+    write_pickle_db_file,
+)
+
+
+_INDEX: pd.Index = pd.Index(["PC 34:1", "PE 36:2", "SM 34:1;2"], name="ID")
+_VECTORS: pd.DataFrame = pd.DataFrame(
+    {"0": [0.5, 1.5, 2.5], "1": [-1.0, 0.0, 1.0]}, index=_INDEX
+)
+_STRINGS: pd.DataFrame = pd.DataFrame(
+    {"NAME": ["PC", "PE", None], "SMILES": ["C", "CC", "CCC"]}, index=_INDEX
+)
+
+
+def _write_db_file(df: pd.DataFrame, path: Path) -> Path:
+    match path.suffix:
+        case ".csv":
+            df.to_csv(path)
+        case ".zip":
+            with zipfile.ZipFile(path, "w") as zip_file:
+                zip_file.writestr(f"{path.stem}.csv", df.to_csv())
+        case ".parquet":
+            df.to_parquet(path)
+        case ".feather":
+            feather.write_feather(df.reset_index(), path)
+        case ".pkl":
+            write_pickle_db_file(df, path)
+
+    return path
+
+
+@pytest.mark.parametrize("buffers", [True, False])
+def test_read_pickle_db_file(tmp_path: Path, buffers: bool) -> None:
+    path: Path = tmp_path / "vectors.pkl"
+    if buffers:
+        write_pickle_db_file(_VECTORS, path)
+    else:
+        _VECTORS.to_pickle(path)
+
+    df: pd.DataFrame = InMemoryDataFrameDB._read_db_file(path, np.float32)
+
+    assert path.with_suffix(".buffers").exists() == buffers
+    assert df.index.to_list() == _INDEX.to_list()
+    np.testing.assert_array_equal(df.to_numpy(), _VECTORS.to_numpy())
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".zip", ".parquet", ".feather"])
+def test_read_numeric_db_file(tmp_path: Path, suffix: str) -> None:
+    path: Path = _write_db_file(_VECTORS, tmp_path / f"vectors{suffix}")
+
+    df: pd.DataFrame = InMemoryDataFrameDB._read_db_file(path, np.float32)
+
+    assert df.index.to_list() == _INDEX.to_list()
+    assert (df.dtypes == np.float32).all()
+    np.testing.assert_array_equal(df.to_numpy(), _VECTORS.to_numpy())
+
+
+def test_read_db_file_unknown_filetype(tmp_path: Path) -> None:
+    path: Path = tmp_path / "vectors.txt"
+    path.write_text("")
+
+    with pytest.raises(ValueError):
+        InMemoryDataFrameDB._read_db_file(path, np.float32)
+
+
+def test_read_numeric_csv_without_float64(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path: Path = _write_db_file(_VECTORS, tmp_path / "vectors.csv")
+    read_csv = pd.read_csv
+    read_dtypes: list[pd.Series] = []
+
+    def read_csv_spy(*args, **kwargs) -> pd.DataFrame:
+        df: pd.DataFrame = read_csv(*args, **kwargs)
+        read_dtypes.append(df.dtypes)
+        return df
+
+    monkeypatch.setattr(pd, "read_csv", read_csv_spy)
+
+    InMemoryDataFrameDB._read_db_file(path, np.float32)
+
+    assert (read_dtypes[0] == np.float32).all()
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("suffix", [".csv", ".zip", ".parquet", ".feather"])
+def test_read_str_db_file(tmp_path: Path, suffix: str) -> None:
+    path: Path = _write_db_file(_STRINGS, tmp_path / f"strings{suffix}")
+
+    df: pd.DataFrame = InMemoryDataFrameDB._read_db_file(path, str)
+
+    assert df.index.to_list() == _INDEX.to_list()
+    assert (df.dtypes == _STR_DTYPE).all()
+    assert df["SMILES"].to_list() == ["C", "CC", "CCC"]
+    assert pd.isna(df.loc["SM 34:1;2", "NAME"])
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".zip"])
+def test_read_str_csv_missing_values(tmp_path: Path, suffix: str) -> None:
+    # Missing value strings are read as by the pandas reader and replaced
+    # by empty strings if missing values are not kept.
+    null_values: list[str] = ["", "NA", "NaN", "null", "None", "<NA>"]
+    strings: pd.DataFrame = pd.DataFrame(
+        {"NAME": null_values + ["PC"]},
+        index=pd.Index([str(i) for i in range(len(null_values) + 1)]),
+    )
+    path: Path = _write_db_file(strings, tmp_path / f"strings{suffix}")
+
+    df: pd.DataFrame = InMemoryDataFrameDB._read_db_file(path, str)
+    df_filled: pd.DataFrame = InMemoryDataFrameDB._read_db_file(
+        path, str, keep_na=False
+    )
+
+    assert df["NAME"].isna().to_list() == [True] * len(null_values) + [False]
+    assert df_filled["NAME"].to_list() == [""] * len(null_values) + ["PC"]
+
+
+def _write_db_files(directory: Path) -> dict[str, Path]:
+    vectors: pd.DataFrame = _VECTORS
+    return {
+        "db_path": _write_db_file(_STRINGS, directory / "database.csv"),
+        "vectors_2d_path": _write_db_file(vectors, directory / "2d.csv"),
+        "vectors_3d_path": _write_db_file(vectors, directory / "3d.csv"),
+        "smiles_path": _write_db_file(
+            _STRINGS[["SMILES"]], directory / "smiles.csv"
+        ),
+    }
+
+
+class _ParsedDatasetSpy:
+    instances: list["_ParsedDatasetSpy"] = []
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df: pd.DataFrame = df
+        self.instances.append(self)
+
+    def get_component_complete_subset(self) -> "_ParsedDatasetSpy":
+        return self
+
+
+def test_from_config_dict_creates_matching_ds(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths: dict[str, Path] = _write_db_files(tmp_path)
+    monkeypatch.setattr(_ParsedDatasetSpy, "instances", [])
+    monkeypatch.setattr(
+        "lipidome_projector.database.in_memory_df_db.ParsedDataset",
+        _ParsedDatasetSpy,
+    )
+
+    database: InMemoryDataFrameDB = InMemoryDataFrameDB.from_config_dict(
+        {"name": "test", **{key: str(path) for key, path in paths.items()}}
+    )
+
+    assert len(_ParsedDatasetSpy.instances) == 1
+    assert _ParsedDatasetSpy.instances[0].df is database.db_df
+    assert database.matching_ds is _ParsedDatasetSpy.instances[0]
+    assert len(_ParsedDatasetSpy.instances) == 1
+
+
+def test_cache_key(tmp_path: Path) -> None:
+    paths: list[Path] = list(_write_db_files(tmp_path).values())
+
+    key: str = InMemoryDataFrameDB._gen_cache_key("test", paths)
+
+    assert InMemoryDataFrameDB._gen_cache_key("test", paths) == key
+    assert InMemoryDataFrameDB._gen_cache_key("other", paths) != key
+
+    os.utime(paths[0], ns=(0, 0))
+
+    assert InMemoryDataFrameDB._gen_cache_key("test", paths) != key
+
+
+def test_from_config_dict_without_cache_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths: dict[str, Path] = _write_db_files(tmp_path)
+    monkeypatch.setattr(InMemoryDataFrameDB, "_warm", lambda self: None)
+
+    database: InMemoryDataFrameDB = InMemoryDataFrameDB.from_config_dict(
+        {"name": "test", **{key: str(path) for key, path in paths.items()}}
+    )
+
+    assert database.db_df.index.to_list() == _INDEX.to_list()
+    assert list(tmp_path.glob("*.pkl")) == []
+
+
+def test_cache_bundle(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    paths: dict[str, Path] = _write_db_files(tmp_path)
+    cache_dir: Path = tmp_path / "cache"
+    monkeypatch.setattr(InMemoryDataFrameDB, "_warm", lambda self: None)
+
+    database: InMemoryDataFrameDB = InMemoryDataFrameDB.from_files_cached(
+        name="test", **paths, cache_dir=cache_dir
+    )
+    bundle_paths: list[Path] = list(cache_dir.glob("*.pkl"))
+
+    assert len(bundle_paths) == 1
+    assert list(cache_dir.iterdir()) == bundle_paths
+
+    monkeypatch.setattr(
+        InMemoryDataFrameDB,
+        "from_files",
+        classmethod(lambda cls, **kwargs: pytest.fail("Bundle not read")),
+    )
+    cached_database: InMemoryDataFrameDB = (
+        InMemoryDataFrameDB.from_files_cached(
+            name="test", **paths, cache_dir=cache_dir
+        )
+    )
+
+    pd.testing.assert_frame_equal(cached_database.db_df, database.db_df)
+    pd.testing.assert_frame_equal(
+        cached_database.vectors_2d, database.vectors_2d
+    )
+
+
+def test_cache_bundle_replaces_stale_bundle(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths: dict[str, Path] = _write_db_files(tmp_path)
+    cache_dir: Path = tmp_path / "cache"
+    other_bundle_path: Path = cache_dir / "test.other.0123.pkl"
+    monkeypatch.setattr(InMemoryDataFrameDB, "_warm", lambda self: None)
+
+    InMemoryDataFrameDB.from_files_cached(
+        name="test", **paths, cache_dir=cache_dir
+    )
+    stale_bundle_path: Path = next(cache_dir.glob("*.pkl"))
+    other_bundle_path.write_bytes(b"")
+
+    os.utime(paths["db_path"], ns=(0, 0))
+    InMemoryDataFrameDB.from_files_cached(
+        name="test", **paths, cache_dir=cache_dir
+    )
+
+    assert not stale_bundle_path.exists()
+    assert other_bundle_path.exists()
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
+def test_unreadable_cache_bundle_is_ignored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths: dict[str, Path] = _write_db_files(tmp_path)
+    cache_dir: Path = tmp_path / "cache"
+    monkeypatch.setattr(InMemoryDataFrameDB, "_warm", lambda self: None)
+
+    InMemoryDataFrameDB.from_files_cached(
+        name="test", **paths, cache_dir=cache_dir
+    )
+    next(cache_dir.glob("*.pkl")).write_bytes(b"truncated")
+
+    database: InMemoryDataFrameDB = InMemoryDataFrameDB.from_files_cached(
+        name="test", **paths, cache_dir=cache_dir
+    )
+
+    assert database.db_df.index.to_list() == _INDEX.to_list()
+
+
+def test_failed_cache_bundle_write_is_removed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths: dict[str, Path] = _write_db_files(tmp_path)
+    cache_dir: Path = tmp_path / "cache"
+    monkeypatch.setattr(InMemoryDataFrameDB, "_warm", lambda self: None)
+
+    def dump_failing(*args, **kwargs) -> None:
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(
+        "lipidome_projector.database.in_memory_df_db.pickle.dump",
+        dump_failing,
+    )
+
+    database: InMemoryDataFrameDB = InMemoryDataFrameDB.from_files_cached(
+        name="test", **paths, cache_dir=cache_dir
+    )
+
+    assert database.db_df.index.to_list() == _INDEX.to_list()
+    assert list(cache_dir.iterdir()) == []
+
+
+def _create_database(**data: pd.DataFrame | pd.Series) -> InMemoryDataFrameDB:
+    vectors: pd.DataFrame = _VECTORS.astype(np.float32)
+    return InMemoryDataFrameDB(
+        **{
+            "name": "test",
+            "db_df": _STRINGS.copy(),
+            "vectors_2d": vectors,
+            "vectors_3d": vectors,
+            "smiles": _STRINGS["SMILES"].copy(),
+            **data,
+        }
+    )
+
+
+def test_combined_array() -> None:
+    database: InMemoryDataFrameDB = _create_database()
+
+    combined_array: np.ndarray = database.combined_array
+
+    assert combined_array.flags.f_contiguous
+    assert not combined_array.flags.writeable
+    np.testing.assert_array_equal(
+        combined_array, np.hstack([_VECTORS.to_numpy()] * 2)
+    )
+    assert np.shares_memory(
+        database.vectors_combined.to_numpy(), combined_array
+    )
+
+
+def test_vectors_share_database_index() -> None:
+    vectors: pd.DataFrame = _VECTORS.astype(np.float32)
+    database: InMemoryDataFrameDB = _create_database(
+        vectors_2d=vectors, vectors_3d=vectors.copy()
+    )
+
+    assert database.vectors_2d.index is database.db_df.index
+    assert database.vectors_3d.index is database.db_df.index
+    assert database.smiles.index is database.db_df.index
+    assert np.shares_memory(database.vectors_2d.to_numpy(), vectors)
+
+
+def test_reordered_vectors_are_aligned() -> None:
+    vectors: pd.DataFrame = _VECTORS.astype(np.float32).iloc[::-1]
+    database: InMemoryDataFrameDB = _create_database(vectors_2d=vectors)
+
+    assert database.vectors_2d.index is database.db_df.index
+    np.testing.assert_array_equal(
+        database.vectors_2d.to_numpy(), _VECTORS.to_numpy()
+    )
+
+
+def test_index_match_skips_set_comparison(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        pd.Index,
+        "symmetric_difference",
+        lambda *args, **kwargs: pytest.fail("Indexes compared as sets"),
+    )
+
+    database: InMemoryDataFrameDB = _create_database()
+
+    assert database.vectors_2d.index is database.db_df.index
+
+
+def test_index_mismatch() -> None:
+    vectors: pd.DataFrame = _VECTORS.astype(np.float32).rename(
+        index={"PE 36:2": "PE 36:3"}
+    )
+
+    with pytest.raises(ValueError, match="3D vectors"):
+        _create_database(vectors_3d=vectors)
@@ -0,0 +1,118 @@
+import base64
+
+import pytest
+
+from lipidome_projector.graph.scatter_cfg import ScatterCfg
+from lipidome_projector.lipidome import session as session_module
+from lipidome_projector.lipidome.grid_data import (
+    ChangeData,
+    GridDataCollection,
+    LipidData,
+    LipidomeData,
+)
+from lipidome_projector.lipidome.session import SessionState
+
+
+def _gen_session(lipidome_name: str = "Sample 1") -> SessionState:
+    lipidome_records: list[dict] = [{"LIPIDOME": lipidome_name, "A": 1.0}]
+
+    return SessionState(
+        gdc=GridDataCollection(
+            lipidome_data=LipidomeData(
+                records=lipidome_records,
+                virtual_records=lipidome_records,
+                col_groups_defs=[{"headerName": "FEATURES"}],
+            ),
+            lipid_data=LipidData(records=[{"LIPID": "PC 34:1"}]),
+            difference_data=ChangeData(),
+            log2fc_data=ChangeData(selected_rows=[{"LIPIDOME": "pair"}]),
+        ),
+        scatter_cfg=ScatterCfg(
+            mode="lipidome",
+            dim=2,
+            sizemode="area",
+            scaling_method="min_max",
+            min_max_scaling_value=[5, 20],
+            linear_scaling_factor=1.0,
+            linear_scaling_base=0.0,
+            template="",
+        ),
+        lipidome_filter_model={},
+        lipid_filter_model={"LIPID": {"filter": "PC"}},
+        difference_filter_model={},
+        log2fc_filter_model={},
+    )
+
+
+def _gen_upload_contents(session_bytes: bytes) -> str:
+    return (
+        "data:application/octet-stream;base64,"
+        f"{base64.b64encode(session_bytes).decode()}"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_session_cache() -> None:
+    session_module._session_cache.clear()
+
+
+def test_json_bytes_round_trip() -> None:
+    session: SessionState = _gen_session("Probe \u00e4")
+
+    assert SessionState.from_json_bytes(session.to_json().encode()) == session
+
+
+def test_plain_json_upload() -> None:
+    session: SessionState = _gen_session()
+
+    contents: str = _gen_upload_contents(session.to_json().encode())
+
+    assert SessionState.from_upload_contents(contents) == session
+
+
+def test_compressed_json_round_trip() -> None:
+    session: SessionState = _gen_session()
+
+    compressed: bytes = session.to_compressed_json()
+
+    assert compressed.startswith(session_module._ZSTD_MAGIC)
+    assert (
+        SessionState.from_upload_contents(_gen_upload_contents(compressed))
+        == session
+    )
+
+
+def test_upload_cache_reuses_parsed_session() -> None:
+    contents: str = _gen_upload_contents(_gen_session().to_json().encode())
+
+    first: SessionState = SessionState.from_upload_contents(contents)
+
+    assert SessionState.from_upload_contents(contents) is first
+
+
+def test_upload_cache_evicts_least_recently_used() -> None:
+    maxsize: int = session_module._SESSION_CACHE_MAXSIZE
+    contents: list[str] = [
+        _gen_upload_contents(_gen_session(f"Sample {i}").to_json().encode())
+        for i in range(maxsize + 1)
+    ]
+
+    sessions: list[SessionState] = [
+        SessionState.from_upload_contents(content)
+        for content in contents[:maxsize]
+    ]
+    # Accessing the first session makes the second one the least recently
+    # used.
+    SessionState.from_upload_contents(contents[0])
+    SessionState.from_upload_contents(contents[maxsize])
+
+    assert len(session_module._session_cache) == maxsize
+    assert SessionState.from_upload_contents(contents[0]) is sessions[0]
+    assert SessionState.from_upload_contents(contents[1]) is not sessions[1]
+
+
+def test_invalid_upload_raises() -> None:
+    with pytest.raises(ValueError):
+        SessionState.from_upload_contents(
+            _gen_upload_contents(b"not a session")
+        )
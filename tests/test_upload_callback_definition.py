@@ -0,0 +1,43 @@
+from dash import no_update
+
+from lipidome_projector.callbacks.upload_callback_definition import (
+    _gen_upload_callback_output,
+)
+from lipidome_projector.lipidome.lipidome_front_end_data import (
+    LipidomeFrontEndData,
+)
+from lipidome_projector.lipidome.upload_processing import (
+    LipidomeUploadFailure,
+    LipidomeUploadResults,
+)
+
+
+def test_upload_failure_output() -> None:
+    output: tuple = _gen_upload_callback_output(
+        LipidomeUploadFailure(failure_message="error"), "success", "failure"
+    )
+
+    assert output == (*(no_update,) * 12, "failure", [], [], [])
+
+
+def test_upload_results_output() -> None:
+    failures_records: list[dict] = [{"LIPID": "XY 1:0"}]
+
+    output: tuple = _gen_upload_callback_output(
+        LipidomeUploadResults(
+            lipidome_fe_data=LipidomeFrontEndData(),
+            failures_records=failures_records,
+            failures_column_defs=[{"field": "LIPID"}],
+        ),
+        "success",
+        "failure",
+    )
+
+    assert len(output) == 16
+    assert output[0] is output[1]
+    assert output[12:] == (
+        "success",
+        [{"field": "LIPID"}],
+        failures_records,
+        failures_records,
+    )